@@ -1,5 +1,6 @@
 """Agent orchestrator for detecting and routing to appropriate workflows."""
 
+import functools
 import re
 from typing import Any
 
@@ -16,6 +17,115 @@ from src.mcp.kite_client import KiteClient
 
 log = structlog.get_logger()
 
+# Routing patterns, checked in order; the first agent with a matching pattern wins
+_ROUTING_PATTERNS: list[tuple[str, list[str]]] = [
+    # Market Context patterns (checked BEFORE portfolio — these are more
+    # specific, requiring causal/directional words like "why", "down",
+    # "crash", "happened".  The market_context agent fetches portfolio
+    # data first, then attributes movements to market news.)
+    ("market_context", [
+        r"why\s+(is|are|did)\s+(my\s+)?(portfolio|stock|market).*(down|up|fall|drop|rise|crash)",
+        r"what\s+(happened|caused).*(market|portfolio|today)",
+        r"market\s+(context|overview|summary|update)",
+        r"explain\s+(today|the)\s*(market|movement|change)",
+        r"(portfolio|market)\s+(drop|crash|rally|surge)",
+        r"how\s+(is|are|was|did)\s+(the\s+)?market",
+        r"(what|how).*(market|nifty|sensex)\s*(today|doing|going|looking)",
+        r"market\s+(today|now|status)",
+    ]),
+    # Portfolio Analysis patterns
+    ("portfolio_analysis", [
+        r"analyz\w*\s+(my\s+)?portfolio",
+        r"(worst|best|top|losing|winning)\s+(performing\s+)?(stock|holding)",
+        r"which\s+(stock|holding).*(worst|best|losing|winning)",
+        r"portfolio\s+(analysis|insight|summary)",
+        r"(deep\s+)?dive\s+(into\s+)?(my\s+)?portfolio",
+        # Change/performance queries
+        r"(change|performance|return|pnl|p&l|profit|loss)\s+(in|of|for)\s+(my\s+)?portfolio",
+        r"(my\s+)?portfolio.*(change|performance|yesterday|today|week|month)",
+        r"how\s+(did|is|has|was)\s+(my\s+)?portfolio",
+        r"(what|show).*(my\s+)?portfolio.*(change|return|pnl|performance)",
+    ]),
+    # Watchlist patterns
+    ("watchlist", [
+        r"watchlist\s*(suggestion|recommend|idea|stock)",
+        r"(suggest|recommend)\s+(stock|share)s?\s*(to\s+)?(watch|buy|add)",
+        r"what\s+(should|can)\s+i\s+(buy|watch|add)",
+        r"(stock|share)s?\s+to\s+(watch|buy|add)",
+        r"(build|create|make)\s+(my\s+)?watchlist",
+        r"(future|next)\s+(buy|investment|stock)",
+        r"what\s+to\s+(buy|invest|watch)",
+    ]),
+    # Stock Events patterns
+    ("stock_events", [
+        r"(events?|corporate\s+action|announcement|board\s+meeting|dividend|merger|acquisition|earning)",
+        r"(what|any|show|get)\s+(events?|announcements?)\s+(for|on|about|around)\s+\w+",
+    ]),
+    # Fundamental Analysis patterns (check before stock_research as it's more specific)
+    ("fundamental_analysis", [
+        r"(is|are)\s+\w+\s+(a\s+)?(good|bad)\s+(buy|stock|investment)",
+        r"fundamental(s)?\s+(analysis|of|for)\s+\w+",
+        r"\w+\s+fundamental(s)?",
+        r"(should\s+i|can\s+i)\s+(buy|invest|hold|sell)\s+\w+",
+        r"(valuation|value)\s+(of|for)\s+\w+",
+        r"(pe|pb|roe|roce|debt)\s+(ratio\s+)?(of|for)\s+\w+",
+        r"(analyze|check)\s+(the\s+)?(financials|fundamentals)\s+(of|for)\s+\w+",
+        r"(good|bad)\s+(stock|investment|buy)\s*\?",
+        r"worth\s+(buying|investing)",
+    ]),
+    # Stock Research patterns
+    ("stock_research", [
+        r"(tell|inform)\s+(me\s+)?(about|regarding)\s+\w+",
+        r"research\s+\w+(\s+stock)?",
+        r"(what|how)\s+(is|about)\s+\w+\s*(stock|share|doing)?",
+        r"(analyze|analysis)\s+(of\s+)?\w+\s*(stock)?",
+        r"\w+\s+(stock|share)\s+(research|analysis|info|details)",
+        r"(news|update)\s+(on|about|for)\s+\w+",
+    ]),
+]
+
+
+# No routing pattern can match a query shorter than this ("event")
+_MIN_AGENT_LEN = 5
+
+# Literals at least one of which every routing pattern requires; queries
+# containing none of them (greetings, thanks, ...) skip the regex scan
+_AGENT_TRIGGER_ROOTS = frozenset({
+    "why", "what", "how", "which", "explain", "tell", "inform",
+    "market", "portfolio", "stock", "share", "holding", "watchlist",
+    "analy", "dive", "research", "news", "update", "future", "next",
+    "event", "corporate", "announcement", "board", "dividend", "merger",
+    "acquisition", "earning", "good", "bad", "worth", "buy", "invest",
+    "hold", "sell", "valu", "fundamental", "financial",
+    "pe", "pb", "roe", "roce", "debt",
+})
+
+
+def _may_route(query_lower: str) -> bool:
+    if len(query_lower) < _MIN_AGENT_LEN:
+        return False
+    return any(root in query_lower for root in _AGENT_TRIGGER_ROOTS)
+
+
+# All routing patterns compiled into one regex. Each agent is a named group
+# holding a lookahead anchored at the start, so the alternatives are tried in
+# priority order (not leftmost match) and m.lastgroup names the winning agent.
+_ROUTING_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?P<{agent_type}>(?=(?s:.*?)(?:{'|'.join(patterns)})))"
+        for agent_type, patterns in _ROUTING_PATTERNS
+    )
+    + ")"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_query(query_lower: str) -> str | None:
+    """Return the agent type for a lowercased query, or None for regular chat."""
+    match = _ROUTING_RE.match(query_lower)
+    return match.lastgroup if match else None
+
 
 class AgentOrchestrator:
     """Orchestrates agent workflows based on user queries."""
@@ -39,107 +149,15 @@ class AgentOrchestrator:
             Tuple of (should_use_agent, agent_type)
         """
         query_lower = query.lower()
+        if not _may_route(query_lower):
+            return False, None
+
+        agent_type = _classify_query(query_lower)
+        if agent_type is None:
+            return False, None
 
-        # Market Context patterns (checked BEFORE portfolio — these are more
-        # specific, requiring causal/directional words like "why", "down",
-        # "crash", "happened".  The market_context agent fetches portfolio
-        # data first, then attributes movements to market news.)
-        context_patterns = [
-            r"why\s+(is|are|did)\s+(my\s+)?(portfolio|stock|market).*(down|up|fall|drop|rise|crash)",
-            r"what\s+(happened|caused).*(market|portfolio|today)",
-            r"market\s+(context|overview|summary|update)",
-            r"explain\s+(today|the)\s*(market|movement|change)",
-            r"(portfolio|market)\s+(drop|crash|rally|surge)",
-            r"how\s+(is|are|was|did)\s+(the\s+)?market",
-            r"(what|how).*(market|nifty|sensex)\s*(today|doing|going|looking)",
-            r"market\s+(today|now|status)",
-        ]
-
-        for pattern in context_patterns:
-            if re.search(pattern, query_lower):
-                log.info("agent_routed", query=query[:80], agent_type="market_context")
-                return True, "market_context"
-
-        # Portfolio Analysis patterns
-        portfolio_patterns = [
-            r"analyz\w*\s+(my\s+)?portfolio",
-            r"(worst|best|top|losing|winning)\s+(performing\s+)?(stock|holding)",
-            r"which\s+(stock|holding).*(worst|best|losing|winning)",
-            r"portfolio\s+(analysis|insight|summary)",
-            r"(deep\s+)?dive\s+(into\s+)?(my\s+)?portfolio",
-            # Change/performance queries
-            r"(change|performance|return|pnl|p&l|profit|loss)\s+(in|of|for)\s+(my\s+)?portfolio",
-            r"(my\s+)?portfolio.*(change|performance|yesterday|today|week|month)",
-            r"how\s+(did|is|has|was)\s+(my\s+)?portfolio",
-            r"(what|show).*(my\s+)?portfolio.*(change|return|pnl|performance)",
-        ]
-
-        for pattern in portfolio_patterns:
-            if re.search(pattern, query_lower):
-                log.info("agent_routed", query=query[:80], agent_type="portfolio_analysis")
-                return True, "portfolio_analysis"
-
-        # Watchlist patterns
-        watchlist_patterns = [
-            r"watchlist\s*(suggestion|recommend|idea|stock)",
-            r"(suggest|recommend)\s+(stock|share)s?\s*(to\s+)?(watch|buy|add)",
-            r"what\s+(should|can)\s+i\s+(buy|watch|add)",
-            r"(stock|share)s?\s+to\s+(watch|buy|add)",
-            r"(build|create|make)\s+(my\s+)?watchlist",
-            r"(future|next)\s+(buy|investment|stock)",
-            r"what\s+to\s+(buy|invest|watch)",
-        ]
-
-        for pattern in watchlist_patterns:
-            if re.search(pattern, query_lower):
-                log.info("agent_routed", query=query[:80], agent_type="watchlist")
-                return True, "watchlist"
-
-        # Stock Events patterns
-        events_patterns = [
-            r"(events?|corporate\s+action|announcement|board\s+meeting|dividend|merger|acquisition|earning)",
-            r"(what|any|show|get)\s+(events?|announcements?)\s+(for|on|about|around)\s+\w+",
-        ]
-
-        for pattern in events_patterns:
-            if re.search(pattern, query_lower):
-                log.info("agent_routed", query=query[:80], agent_type="stock_events")
-                return True, "stock_events"
-
-        # Fundamental Analysis patterns (check before stock_research as it's more specific)
-        fundamental_patterns = [
-            r"(is|are)\s+\w+\s+(a\s+)?(good|bad)\s+(buy|stock|investment)",
-            r"fundamental(s)?\s+(analysis|of|for)\s+\w+",
-            r"\w+\s+fundamental(s)?",
-            r"(should\s+i|can\s+i)\s+(buy|invest|hold|sell)\s+\w+",
-            r"(valuation|value)\s+(of|for)\s+\w+",
-            r"(pe|pb|roe|roce|debt)\s+(ratio\s+)?(of|for)\s+\w+",
-            r"(analyze|check)\s+(the\s+)?(financials|fundamentals)\s+(of|for)\s+\w+",
-            r"(good|bad)\s+(stock|investment|buy)\s*\?",
-            r"worth\s+(buying|investing)",
-        ]
-
-        for pattern in fundamental_patterns:
-            if re.search(pattern, query_lower):
-                log.info("agent_routed", query=query[:80], agent_type="fundamental_analysis")
-                return True, "fundamental_analysis"
-
-        # Stock Research patterns
-        research_patterns = [
-            r"(tell|inform)\s+(me\s+)?(about|regarding)\s+\w+",
-            r"research\s+\w+(\s+stock)?",
-            r"(what|how)\s+(is|about)\s+\w+\s*(stock|share|doing)?",
-            r"(analyze|analysis)\s+(of\s+)?\w+\s*(stock)?",
-            r"\w+\s+(stock|share)\s+(research|analysis|info|details)",
-            r"(news|update)\s+(on|about|for)\s+\w+",
-        ]
-
-        for pattern in research_patterns:
-            if re.search(pattern, query_lower):
-                log.info("agent_routed", query=query[:80], agent_type="stock_research")
-                return True, "stock_research"
-
-        return False, None
+        log.info("agent_routed", query=query[:80], agent_type=agent_type)
+        return True, agent_type
 
     async def run_agent(
         self,
@@ -199,8 +217,7 @@ class AgentOrchestrator:
             }
 
         elif agent_type == "stock_events":
-            events = await self._events_agent.get_events(query)
-            formatted = await self._events_agent.get_events_formatted(query)
+            events, formatted = await self._events_agent.get_events_with_formatted(query)
             log.info("agent_completed", agent_type=agent_type, agent_name="Stock Events Agent")
             return {
                 "response": formatted,
@@ -1,9 +1,11 @@
 """Fundamental Analysis Agent using screener.in data, news, and LLM synthesis."""
 
 import operator
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Annotated, Any, TypedDict
 
+import numpy as np
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 
@@ -22,6 +24,23 @@ def replace_value(current: Any, new: Any) -> Any:
     return new
 
 
+# Lower bounds of total_score for each recommendation above STRONG SELL
+_RECOMMENDATION_THRESHOLDS = (-4, -1, 2, 5)
+_RECOMMENDATIONS = ("STRONG SELL", "SELL", "HOLD", "BUY", "STRONG BUY")
+
+# Per-category scores returned by analyze_fundamentals_batch, one row per stock
+SCORE_DTYPE = np.dtype(
+    [
+        ("valuation", np.int8),
+        ("profitability", np.int8),
+        ("growth", np.int8),
+        ("financial_health", np.int8),
+        ("promoter", np.int8),
+        ("total", np.int8),
+    ]
+)
+
+
 class FundamentalAnalysisState(TypedDict):
     """State schema for fundamental analysis workflow."""
 
@@ -70,17 +89,7 @@ class FundamentalScore:
     @property
     def recommendation(self) -> str:
         """Get recommendation based on total score."""
-        score = self.total_score
-        if score >= 5:
-            return "STRONG BUY"
-        elif score >= 2:
-            return "BUY"
-        elif score >= -1:
-            return "HOLD"
-        elif score >= -4:
-            return "SELL"
-        else:
-            return "STRONG SELL"
+        return _RECOMMENDATIONS[bisect_right(_RECOMMENDATION_THRESHOLDS, self.total_score)]
 
 
 def analyze_fundamentals(data: FundamentalData) -> FundamentalScore:
@@ -240,6 +249,60 @@ def analyze_fundamentals(data: FundamentalData) -> FundamentalScore:
     return score
 
 
+def analyze_fundamentals_batch(datas: list[FundamentalData]) -> np.ndarray:
+    """Score many stocks at once with the same criteria as analyze_fundamentals.
+
+    Only the numeric scores are computed; use analyze_fundamentals when the
+    explanatory notes are needed.
+
+    Args:
+        datas: Fundamental data for each stock.
+
+    Returns:
+        Structured array with SCORE_DTYPE, one row per input in order.
+    """
+    n = len(datas)
+
+    def column(name: str) -> np.ndarray:
+        return np.fromiter((getattr(d, name) for d in datas), dtype=float, count=n)
+
+    pe, pb, dy = column("pe_ratio"), column("pb_ratio"), column("dividend_yield")
+    valuation = (
+        np.select([pe <= 0, pe < 15, pe < 25, pe < 40], [0, 2, 1, 0], -1)
+        + np.select([pb <= 0, pb < 2, pb > 5], [0, 1, -1], 0)
+        + (dy > 2)
+    )
+
+    roe, roce = column("roe"), column("roce")
+    profitability = np.select(
+        [roe <= 0, roe >= 20, roe >= 15, roe >= 10], [0, 2, 1, 0], -1
+    ) + np.select([roce <= 0, roce >= 20, roce < 10], [0, 1, -1], 0)
+
+    growth = sum(
+        np.select([g <= 0, g >= 15, g < 5], [0, 1, -1], 0)
+        for g in (column("revenue_growth_3yr"), column("profit_growth_3yr"))
+    )
+
+    de, cr = column("debt_to_equity"), column("current_ratio")
+    financial_health = np.select(
+        [de < 0, de < 0.5, de < 1, de < 2], [0, 2, 1, 0], -2
+    ) + np.select([cr <= 0, cr >= 2, cr < 1], [0, 1, -1], 0)
+
+    holding, change = column("promoter_holding"), column("promoter_holding_change")
+    promoter = np.select([holding <= 0, holding >= 60, holding < 30], [0, 1, -1], 0) + (
+        np.select([change > 0, change < -2], [1, -1], 0)
+    )
+
+    scores = np.empty(n, dtype=SCORE_DTYPE)
+    scores["valuation"] = np.clip(valuation, -2, 2)
+    scores["profitability"] = np.clip(profitability, -2, 2)
+    scores["growth"] = np.clip(growth, -2, 2)
+    scores["financial_health"] = np.clip(financial_health, -2, 2)
+    scores["promoter"] = np.clip(promoter, -2, 2)
+    scores["total"] = sum(scores[name] for name in SCORE_DTYPE.names[:-1])
+    return scores
+
+
 def format_fundamentals_for_llm(data: FundamentalData, score: FundamentalScore) -> str:
     """Format fundamental data as context for LLM."""
     lines = []
@@ -244,6 +244,19 @@ class StockEventsAgent:
             cfg["configurable"] = {"kite_client": self._client}
         return cfg
 
+    async def _run(self, query: str, symbol: str | None) -> dict[str, Any]:
+        initial_state: dict[str, Any] = {
+            "query": query,
+            "symbol": symbol or "",
+            "symbols": [],
+            "events": [],
+            "formatted_output": "",
+            "error": None,
+            "steps_completed": [],
+        }
+
+        return await self._graph.ainvoke(initial_state, self._config())
+
     async def get_events(
         self, query: str, symbol: str | None = None
     ) -> list[dict]:
@@ -256,32 +269,30 @@ class StockEventsAgent:
         Returns:
             List of event dicts with title, category, date, url, symbol
         """
-        initial_state: dict[str, Any] = {
-            "query": query,
-            "symbol": symbol or "",
-            "symbols": [],
-            "events": [],
-            "formatted_output": "",
-            "error": None,
-            "steps_completed": [],
-        }
-
-        final_state = await self._graph.ainvoke(initial_state, self._config())
+        final_state = await self._run(query, symbol)
         return final_state.get("events", [])
 
     async def get_events_formatted(
         self, query: str, symbol: str | None = None
     ) -> str:
         """Run workflow and return formatted string output."""
-        initial_state: dict[str, Any] = {
-            "query": query,
-            "symbol": symbol or "",
-            "symbols": [],
-            "events": [],
-            "formatted_output": "",
-            "error": None,
-            "steps_completed": [],
-        }
-
-        final_state = await self._graph.ainvoke(initial_state, self._config())
+        final_state = await self._run(query, symbol)
         return final_state.get("formatted_output", "No events found.")
+
+    async def get_events_with_formatted(
+        self, query: str, symbol: str | None = None
+    ) -> tuple[list[dict], str]:
+        """Run workflow once and return both the events and formatted output.
+
+        Args:
+            query: User's query
+            symbol: Optional explicit symbol
+
+        Returns:
+            Tuple of (events, formatted_output)
+        """
+        final_state = await self._run(query, symbol)
+        return (
+            final_state.get("events", []),
+            final_state.get("formatted_output", "No events found."),
+        )
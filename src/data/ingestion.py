@@ -5,10 +5,14 @@ from dataclasses import dataclass
 
 from src.data.scrapers.economictimes import EconomicTimesScraper
 from src.data.scrapers.moneycontrol import MoneyControlScraper, NewsArticle
-from src.rag.chunking import smart_chunk
+from src.rag.chunking import Chunk, smart_chunk
 from src.rag.vector_store import Document, VectorStore, get_vector_store
 
 
+# Max symbols whose news is fetched at the same time
+DEFAULT_MAX_CONCURRENCY = 10
+
+
 @dataclass
 class IngestionStats:
     """Statistics from an ingestion run."""
@@ -27,10 +31,21 @@ class NewsIngestionPipeline:
         vector_store: VectorStore | None = None,
         chunk_size: int = 512,
         chunk_strategy: str = "sentences",
+        pool_chunks: bool = False,
     ):
+        """Initialize the pipeline.
+
+        Args:
+            vector_store: Store to write to (defaults to the shared store)
+            chunk_size: Target chunk size
+            chunk_strategy: Chunking strategy passed to smart_chunk
+            pool_chunks: Store one document per article with a chunk-pooled
+                embedding instead of one document per chunk
+        """
         self._store = vector_store or get_vector_store()
         self._chunk_size = chunk_size
         self._chunk_strategy = chunk_strategy
+        self._pool_chunks = pool_chunks
 
     async def ingest_latest_news(self, limit: int = 20) -> IngestionStats:
         """Fetch and store latest Indian stock market news.
@@ -64,23 +79,24 @@ class NewsIngestionPipeline:
         stats.articles_fetched = len(all_articles)
 
         # Process and store articles
-        documents = self._process_articles(all_articles)
-        stats.chunks_created = len(documents)
-
-        if documents:
-            self._store.add_documents(documents)
-            stats.chunks_stored = len(documents)
+        self._store_articles(all_articles, stats)
 
         return stats
 
     async def ingest_stock_news(
-        self, symbols: list[str], limit: int = 10
+        self,
+        symbols: list[str],
+        limit: int = 10,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> IngestionStats:
         """Fetch and store news for specific Indian stocks.
 
+        Symbols are fetched concurrently, at most max_concurrency at a time.
+
         Args:
             symbols: List of stock symbols (e.g., ["RELIANCE", "TCS", "GABRIEL"])
             limit: Max articles per symbol per source
+            max_concurrency: Max symbols fetched at once
         """
         stats = IngestionStats(
             articles_fetched=0,
@@ -90,15 +106,21 @@ class NewsIngestionPipeline:
         )
 
         all_articles: list[NewsArticle] = []
+        sem = asyncio.Semaphore(max_concurrency)
 
         async with MoneyControlScraper() as mc, EconomicTimesScraper() as et:
-            for symbol in symbols:
-                results = await asyncio.gather(
-                    mc.search_news(symbol, limit),
-                    et.search_news(symbol, limit),
-                    return_exceptions=True,
-                )
 
+            async def fetch_symbol(symbol: str) -> list[list[NewsArticle] | BaseException]:
+                async with sem:
+                    return await asyncio.gather(
+                        mc.search_news(symbol, limit),
+                        et.search_news(symbol, limit),
+                        return_exceptions=True,
+                    )
+
+            per_symbol = await asyncio.gather(*(fetch_symbol(symbol) for symbol in symbols))
+
+            for symbol, results in zip(symbols, per_symbol):
                 for result in results:
                     if isinstance(result, Exception):
                         stats.errors.append(f"{symbol}: {result}")
@@ -111,29 +133,70 @@ class NewsIngestionPipeline:
 
         stats.articles_fetched = len(all_articles)
 
-        documents = self._process_articles(all_articles)
+        # Process and store articles
+        self._store_articles(all_articles, stats)
+
+        return stats
+
+    def _store_articles(self, articles: list[NewsArticle], stats: IngestionStats) -> None:
+        """Chunk articles, store them and record counts in stats."""
+        if self._pool_chunks:
+            pooled = self._process_articles_pooled(articles)
+            stats.chunks_created = sum(len(chunks) for _, chunks in pooled)
+            for doc, chunks in pooled:
+                self._store.add_article(doc, chunks)
+            stats.chunks_stored = len(pooled)
+            return
+
+        documents = self._process_articles(articles)
         stats.chunks_created = len(documents)
 
         if documents:
             self._store.add_documents(documents)
             stats.chunks_stored = len(documents)
 
-        return stats
+    def _chunk_article(self, article: NewsArticle) -> list[Chunk]:
+        """Chunk an article's content, skipping articles that are too short."""
+        if not article.content or len(article.content) < 50:
+            return []
+
+        return smart_chunk(
+            article.content,
+            strategy=self._chunk_strategy,
+            chunk_size=self._chunk_size,
+        )
+
+    def _process_articles_pooled(
+        self, articles: list[NewsArticle]
+    ) -> list[tuple[Document, list[Chunk]]]:
+        """Convert articles to article-level documents paired with their chunks."""
+        pooled = []
+
+        for article in articles:
+            chunks = self._chunk_article(article)
+            if not chunks:
+                continue
+
+            doc = Document.create(
+                content=article.content,
+                source=article.source,
+                symbol=article.symbol,
+                published_at=article.published_at,
+                title=article.title,
+                url=article.url,
+            )
+            doc.metadata["total_chunks"] = len(chunks)
+            pooled.append((doc, chunks))
+
+        return pooled
 
     def _process_articles(self, articles: list[NewsArticle]) -> list[Document]:
         """Convert articles to chunked documents."""
         documents = []
 
         for article in articles:
-            if not article.content or len(article.content) < 50:
-                continue
-
             # Chunk the article content
-            chunks = smart_chunk(
-                article.content,
-                strategy=self._chunk_strategy,
-                chunk_size=self._chunk_size,
-            )
+            chunks = self._chunk_article(article)
 
             for chunk in chunks:
                 # Create document with chunk metadata
@@ -144,9 +207,8 @@ class NewsIngestionPipeline:
                     published_at=article.published_at,
                     title=article.title,
                     url=article.url,
+                    chunk_idx=chunk.chunk_idx,
                 )
-                # Add chunk index to metadata
-                doc.metadata["chunk_idx"] = chunk.chunk_idx
                 doc.metadata["total_chunks"] = len(chunks)
                 documents.append(doc)
 
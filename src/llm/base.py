@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A tool call from an LLM."""
 
@@ -14,7 +14,7 @@ class ToolCall:
     input: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletionResponse:
     """Response from an LLM completion request."""
 
@@ -23,7 +23,7 @@ class CompletionResponse:
     stop_reason: str = "end_turn"
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """An event from a streaming response."""
 
@@ -1,8 +1,16 @@
 """Factory functions for creating LLM providers."""
 
-from src.core.config import get_config
+import asyncio
+
+from src.core.config import LLMConfig, get_config
 from src.llm.base import LLMProvider, SimpleProvider
 
+# Simple provider shared by workflow runs on the same event loop, so agent
+# invocations reuse one HTTP connection pool instead of opening a new one each
+# time. Keyed by the provider config; the loop is tracked because async HTTP
+# clients can't be used across event loops.
+_simple_provider: tuple[tuple[str, ...], asyncio.AbstractEventLoop, SimpleProvider] | None = None
+
 
 def get_llm_provider() -> LLMProvider:
     """Get an LLM provider based on current configuration.
@@ -28,13 +36,33 @@ def get_llm_provider() -> LLMProvider:
 def get_simple_provider() -> SimpleProvider:
     """Get a simple LLM provider for basic completions.
 
-    Used by workflow nodes that don't need tool calling.
+    Used by workflow nodes that don't need tool calling. Inside a running
+    event loop the instance is reused until the configuration changes.
 
     Returns:
         SimpleProvider instance (either Claude or Ollama)
     """
+    global _simple_provider
     config = get_config()
+    key = (config.provider, config.claude_model, config.ollama_base_url, config.ollama_model)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _create_simple_provider(config)
+
+    if _simple_provider is not None:
+        cached_key, cached_loop, provider = _simple_provider
+        if cached_key == key and cached_loop is loop:
+            return provider
+
+    provider = _create_simple_provider(config)
+    _simple_provider = (key, loop, provider)
+    return provider
+
 
+def _create_simple_provider(config: LLMConfig) -> SimpleProvider:
+    """Create a new simple provider for the given configuration."""
     if config.provider == "claude":
         from src.llm.claude import ClaudeSimpleProvider
 
@@ -1,15 +1,64 @@
 """Ollama LLM provider implementation."""
 
-import json
-from collections.abc import AsyncIterator
+import asyncio
+import functools
+import hashlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import httpx
+import orjson
 
 from src.core.config import get_config
 from src.core.observability import trace_llm_call
 from src.llm.base import CompletionResponse, StreamEvent, ToolCall
 from src.llm.tool_parser import format_tools_as_prompt, parse_tool_calls_from_text
+from src.llm.tools import ALL_TOOLS, ALL_TOOLS_PROMPT
+
+_TOOL_RESULT_TMPL = "Tool result ({id}):\n```json\n{body}\n```"
+_VALID_ROLES = frozenset(("user", "assistant", "system"))
+
+# Tool results and messages may carry non-str keys or arbitrary objects;
+# encode those the way json.dumps callers tolerated them instead of failing
+_ORJSON_LENIENT = orjson.OPT_NON_STR_KEYS
+
+# Connection pool sizing shared by both providers
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RESPONSE_CACHE_SIZE = 128
+
+# Responses longer than this are parsed for tool calls off the event loop
+_TOOL_PARSE_OFFLOAD_CHARS = 32_000
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Byte markers for cheap pre-filtering of streamed NDJSON lines
+_EMPTY_CONTENT_MARKER = b'"content":""'
+_DONE_MARKER = b'"done":true'
+
+
+@functools.lru_cache(maxsize=32)
+def _payload_prefix(model: str, stream: bool, max_tokens: int) -> bytes:
+    """Pre-serialize the static part of a chat payload, up to the messages value."""
+    static = orjson.dumps({
+        "model": model,
+        "stream": stream,
+        "options": {
+            "num_predict": max_tokens,
+        },
+    })
+    return static[:-1] + b',"messages":'
+
+
+def _encode_chat_payload(
+    model: str,
+    messages: list[dict[str, str]],
+    stream: bool,
+    max_tokens: int,
+) -> bytes:
+    """Encode an /api/chat request body, reusing the cached static prefix."""
+    body = orjson.dumps(messages, default=str, option=_ORJSON_LENIENT)
+    return _payload_prefix(model, stream, max_tokens) + body + b"}"
 
 
 class OllamaProvider:
@@ -20,6 +69,7 @@ class OllamaProvider:
         base_url: str | None = None,
         model: str | None = None,
         timeout: float = 120.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize Ollama provider.
 
@@ -27,12 +77,14 @@ class OllamaProvider:
             base_url: Ollama API base URL (defaults to config)
             model: Model name (defaults to config)
             timeout: Request timeout in seconds
+            max_concurrency: Maximum number of in-flight requests to Ollama
         """
         config = get_config()
         self._base_url = (base_url or config.ollama_base_url).rstrip("/")
         self._model = model or config.ollama_model
         self._timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._client = httpx.AsyncClient(timeout=timeout, limits=_POOL_LIMITS)
+        self._sem = asyncio.Semaphore(max_concurrency)
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -44,6 +96,33 @@ class OllamaProvider:
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
+    @staticmethod
+    def _build_messages_fast(
+        messages: list[dict[str, Any]],
+        system: str | None = None,
+    ) -> list[dict[str, str]]:
+        """Build Ollama-formatted messages when all content is plain text.
+
+        Args:
+            messages: Input messages, each with string content
+            system: System prompt
+
+        Returns:
+            Ollama-formatted messages
+        """
+        ollama_messages: list[dict[str, str]] = []
+        if system:
+            ollama_messages.append({"role": "system", "content": system})
+
+        for msg in messages:
+            role = msg.get("role", "user")
+            ollama_messages.append({
+                "role": role if role in _VALID_ROLES else "user",
+                "content": msg["content"],
+            })
+
+        return ollama_messages
+
     def _build_messages(
         self,
         messages: list[dict[str, Any]],
@@ -60,19 +139,27 @@ class OllamaProvider:
         Returns:
             Ollama-formatted messages
         """
+        # Common case: no tools and plain string content only
+        if not tools and all(isinstance(m.get("content"), str) for m in messages):
+            return self._build_messages_fast(messages, system)
+
         ollama_messages: list[dict[str, str]] = []
 
         # Build system message with tool instructions
         system_parts = []
         if system:
             system_parts.append(system)
-        if tools:
+        if tools is ALL_TOOLS:
+            system_parts.append(ALL_TOOLS_PROMPT)
+        elif tools:
             system_parts.append(format_tools_as_prompt(tools))
 
         if system_parts:
             ollama_messages.append({
                 "role": "system",
-                "content": "\n\n".join(system_parts),
+                "content": (
+                    system_parts[0] if len(system_parts) == 1 else "\n\n".join(system_parts)
+                ),
             })
 
         # Convert messages
@@ -82,28 +169,36 @@ class OllamaProvider:
 
             # Handle Claude-style content arrays
             if isinstance(content, list):
-                text_parts = []
+                text_parts: list[str] = []
+                append = text_parts.append
                 for block in content:
                     if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-                        elif block.get("type") == "tool_result":
+                        block_type = block.get("type")
+                        if block_type == "text":
+                            append(block.get("text", ""))
+                        elif block_type == "tool_result":
                             # Format tool result as pretty-printed JSON
                             result = block.get("content")
                             if result is None:
                                 result_json = ""
                             else:
-                                result_json = json.dumps(result, ensure_ascii=False, indent=2)
-                            tool_id = block.get("tool_use_id", "unknown")
-                            text_parts.append(
-                                f"Tool result ({tool_id}):\n```json\n{result_json}\n```"
+                                result_json = orjson.dumps(
+                                    result,
+                                    default=str,
+                                    option=orjson.OPT_INDENT_2 | _ORJSON_LENIENT,
+                                ).decode()
+                            append(
+                                _TOOL_RESULT_TMPL.format(
+                                    id=block.get("tool_use_id", "unknown"),
+                                    body=result_json,
+                                )
                             )
                     else:
-                        text_parts.append(str(block))
+                        append(str(block))
                 content = "\n".join(text_parts)
 
             ollama_messages.append({
-                "role": role if role in ("user", "assistant", "system") else "user",
+                "role": role if role in _VALID_ROLES else "user",
                 "content": content,
             })
 
@@ -130,20 +225,15 @@ class OllamaProvider:
         """
         ollama_messages = self._build_messages(messages, system, tools)
 
-        payload = {
-            "model": self._model,
-            "messages": ollama_messages,
-            "stream": False,
-            "options": {
-                "num_predict": max_tokens,
-            },
-        }
+        payload = _encode_chat_payload(self._model, ollama_messages, False, max_tokens)
 
         try:
-            response = await self._client.post(
-                f"{self._base_url}/api/chat",
-                json=payload,
-            )
+            async with self._sem:
+                response = await self._client.post(
+                    f"{self._base_url}/api/chat",
+                    content=payload,
+                    headers=_JSON_HEADERS,
+                )
             response.raise_for_status()
         except httpx.ConnectError as e:
             raise ConnectionError(
@@ -156,11 +246,17 @@ class OllamaProvider:
                 f"Make sure model '{self._model}' is available ('ollama pull {self._model}')."
             ) from e
 
-        data = response.json()
+        data = orjson.loads(response.content)
         content = data.get("message", {}).get("content", "")
 
-        # Parse tool calls from response
-        remaining_text, tool_calls = parse_tool_calls_from_text(content, tools)
+        # Parse tool calls from response; large responses are parsed in a
+        # worker thread so concurrent requests aren't starved
+        if len(content) > _TOOL_PARSE_OFFLOAD_CHARS:
+            remaining_text, tool_calls = await asyncio.to_thread(
+                parse_tool_calls_from_text, content, tools
+            )
+        else:
+            remaining_text, tool_calls = parse_tool_calls_from_text(content, tools)
 
         # If tool calls were found, discard remaining text (likely hallucinated results)
         # The model tends to output tool calls then immediately hallucinate responses
@@ -176,6 +272,74 @@ class OllamaProvider:
             stop_reason=stop_reason,
         )
 
+    async def complete_many(
+        self,
+        batch: list[
+            tuple[
+                list[dict[str, Any]],
+                str | None,
+                list[dict[str, Any]] | None,
+                int,
+            ]
+        ],
+        *,
+        concurrency: int = 4,
+    ) -> list[CompletionResponse]:
+        """Run several completions concurrently.
+
+        All requests are submitted up front and awaited together with
+        asyncio.gather; a semaphore caps how many are in flight at once.
+
+        Args:
+            batch: List of (messages, system, tools, max_tokens) tuples
+            concurrency: Maximum number of completions running at once
+
+        Returns:
+            CompletionResponses in the same order as the batch
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run_one(
+            messages: list[dict[str, Any]],
+            system: str | None,
+            tools: list[dict[str, Any]] | None,
+            max_tokens: int,
+        ) -> CompletionResponse:
+            async with sem:
+                return await self.complete(messages, system, tools, max_tokens)
+
+        return await asyncio.gather(*(run_one(*args) for args in batch))
+
+    @staticmethod
+    def _parse_stream_line(raw: bytes) -> list[StreamEvent]:
+        """Parse one NDJSON line of an Ollama chat stream into events.
+
+        Args:
+            raw: A single line of the response body, without the newline
+
+        Returns:
+            Text and/or done events carried by the line (empty if none)
+        """
+        if not raw.strip():
+            return []
+
+        # Heartbeat chunks carry no text and aren't final: skip the parse
+        if _EMPTY_CONTENT_MARKER in raw and _DONE_MARKER not in raw:
+            return []
+
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return []
+
+        events: list[StreamEvent] = []
+        content = data.get("message", {}).get("content", "")
+        if content:
+            events.append(StreamEvent(type="text", text=content))
+        if data.get("done", False):
+            events.append(StreamEvent(type="done"))
+        return events
+
     async def stream(
         self,
         messages: list[dict[str, Any]],
@@ -215,41 +379,38 @@ class OllamaProvider:
         # For non-tool requests, use streaming
         ollama_messages = self._build_messages(messages, system, None)
 
-        payload = {
-            "model": self._model,
-            "messages": ollama_messages,
-            "stream": True,
-            "options": {
-                "num_predict": max_tokens,
-            },
-        }
+        payload = _encode_chat_payload(self._model, ollama_messages, True, max_tokens)
 
         try:
-            async with self._client.stream(
+            async with self._sem, self._client.stream(
                 "POST",
                 f"{self._base_url}/api/chat",
-                json=payload,
+                content=payload,
+                headers=_JSON_HEADERS,
             ) as response:
                 response.raise_for_status()
 
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    message = data.get("message", {})
-                    content = message.get("content", "")
-
-                    if content:
-                        yield StreamEvent(type="text", text=content)
-
-                    if data.get("done", False):
-                        yield StreamEvent(type="done")
+                # Split NDJSON on raw bytes so each line is parsed by orjson
+                # without an intermediate str decode
+                buf = bytearray()
+                done = False
+                async for chunk in response.aiter_bytes():
+                    buf += chunk
+                    while (nl := buf.find(b"\n")) >= 0:
+                        raw = bytes(buf[:nl])
+                        del buf[: nl + 1]
+                        for event in self._parse_stream_line(raw):
+                            yield event
+                            done = event.type == "done"
+                        if done:
+                            break
+                    if done:
                         break
+
+                # Trailing line without a terminating newline
+                if not done and buf:
+                    for event in self._parse_stream_line(bytes(buf)):
+                        yield event
         except httpx.ConnectError as e:
             raise ConnectionError(
                 f"Cannot connect to Ollama at {self._base_url}. "
@@ -270,6 +431,9 @@ class OllamaSimpleProvider:
         base_url: str | None = None,
         model: str | None = None,
         timeout: float = 120.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_size: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        similarity_lookup: Callable[[list[dict[str, str]]], str | None] | None = None,
     ):
         """Initialize simple Ollama provider.
 
@@ -277,12 +441,21 @@ class OllamaSimpleProvider:
             base_url: Ollama API base URL (defaults to config)
             model: Model name (defaults to config)
             timeout: Request timeout in seconds
+            max_concurrency: Maximum number of in-flight requests to Ollama
+            cache_size: Max responses kept in the exact-match cache (0 disables)
+            similarity_lookup: Optional hook called on a cache miss with the
+                Ollama-formatted messages; returning a string (e.g. from an
+                embedding-based lookup) skips the request
         """
         config = get_config()
         self._base_url = (base_url or config.ollama_base_url).rstrip("/")
         self._model = model or config.ollama_model
         self._timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._client = httpx.AsyncClient(timeout=timeout, limits=_POOL_LIMITS)
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+        self._cache_size = cache_size
+        self._similarity_lookup = similarity_lookup
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -325,24 +498,31 @@ class OllamaSimpleProvider:
                 content = "\n".join(text_parts)
 
             ollama_messages.append({
-                "role": role if role in ("user", "assistant", "system") else "user",
+                "role": role if role in _VALID_ROLES else "user",
                 "content": content,
             })
 
-        payload = {
-            "model": self._model,
-            "messages": ollama_messages,
-            "stream": False,
-            "options": {
-                "num_predict": max_tokens,
-            },
-        }
+        payload = _encode_chat_payload(self._model, ollama_messages, False, max_tokens)
+
+        # The encoded payload covers model, system, messages and max_tokens
+        cache_key = hashlib.blake2b(payload, digest_size=16).digest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        if self._similarity_lookup is not None:
+            similar = self._similarity_lookup(ollama_messages)
+            if similar is not None:
+                return similar
 
         try:
-            response = await self._client.post(
-                f"{self._base_url}/api/chat",
-                json=payload,
-            )
+            async with self._sem:
+                response = await self._client.post(
+                    f"{self._base_url}/api/chat",
+                    content=payload,
+                    headers=_JSON_HEADERS,
+                )
             response.raise_for_status()
         except httpx.ConnectError as e:
             raise ConnectionError(
@@ -355,5 +535,12 @@ class OllamaSimpleProvider:
                 f"Make sure model '{self._model}' is available ('ollama pull {self._model}')."
             ) from e
 
-        data = response.json()
-        return data.get("message", {}).get("content", "")
+        data = orjson.loads(response.content)
+        content = data.get("message", {}).get("content", "")
+
+        if self._cache_size > 0:
+            self._cache[cache_key] = content
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return content
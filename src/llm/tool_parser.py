@@ -5,17 +5,28 @@ approach where tools are described in the system prompt and the model outputs
 structured tool calls in a specific format.
 """
 
+import functools
+import io
+import itertools
 import json
 import re
-import uuid
+import secrets
 from typing import Any
 
 from src.llm.base import ToolCall
 
+# Tool call IDs only need to be unique within a process: a random
+# per-process prefix plus a counter avoids an os.urandom call per ID
+_ID_PREFIX = secrets.token_hex(3)
+_ID_COUNTER = itertools.count()
+
 
 def format_tools_as_prompt(tools: list[dict[str, Any]]) -> str:
     """Convert tool definitions to a prompt instruction for Ollama.
 
+    The formatted prompt is cached on the tool definitions' content, so
+    repeated calls with the same (static) tool list skip the rebuild.
+
     Args:
         tools: List of tool definitions with name, description, input_schema
 
@@ -25,47 +36,78 @@ def format_tools_as_prompt(tools: list[dict[str, Any]]) -> str:
     if not tools:
         return ""
 
-    lines = [
-        "",
-        "## TOOLS",
-        "",
-        "You have access to tools. To use a tool, output ONLY a JSON object like this:",
-        "",
-        '{"name": "tool_name", "input": {}}',
-        "",
-        "IMPORTANT RULES:",
-        "1. Output ONLY the JSON when calling a tool - no other text",
-        "2. Wait for tool results before continuing",
-        "3. Only use parameters that are defined for each tool",
-        "",
-        "Available tools:",
-        "",
-    ]
-
-    for tool in tools:
-        name = tool.get("name", "unknown")
-        description = tool.get("description", "No description")
-        schema = tool.get("input_schema", {})
-
-        lines.append(f"### {name}")
-        lines.append(f"{description}")
+    tools_key = tuple(
+        (
+            tool.get("name", "unknown"),
+            tool.get("description", "No description"),
+            json.dumps(tool.get("input_schema", {})),
+        )
+        for tool in tools
+    )
+    return _format_tools_as_prompt_cached(tools_key)
+
+
+_TOOLS_PROMPT_HEADER = """
+## TOOLS
+
+You have access to tools. To use a tool, output ONLY a JSON object like this:
+
+{"name": "tool_name", "input": {}}
+
+IMPORTANT RULES:
+1. Output ONLY the JSON when calling a tool - no other text
+2. Wait for tool results before continuing
+3. Only use parameters that are defined for each tool
+
+Available tools:
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _format_tools_as_prompt_cached(tools_key: tuple[tuple[str, str, str], ...]) -> str:
+    """Build the tool prompt from a hashable (name, description, schema_json) key."""
+    buf = io.StringIO()
+    buf.write(_TOOLS_PROMPT_HEADER)
+
+    for name, description, schema_json in tools_key:
+        schema = json.loads(schema_json)
+
+        buf.write(f"\n### {name}\n{description}")
 
         properties = schema.get("properties", {})
         required = schema.get("required", [])
 
         if properties:
-            lines.append("Parameters:")
+            buf.write("\nParameters:")
             for prop_name, prop_def in properties.items():
                 prop_type = prop_def.get("type", "any")
                 prop_desc = prop_def.get("description", "")
                 req_marker = " (REQUIRED)" if prop_name in required else " (optional)"
-                lines.append(f"  - {prop_name} ({prop_type}){req_marker}: {prop_desc}")
+                buf.write(f"\n  - {prop_name} ({prop_type}){req_marker}: {prop_desc}")
         else:
-            lines.append("Parameters: none")
+            buf.write("\nParameters: none")
+
+        buf.write("\n")
+
+    return buf.getvalue()
 
-        lines.append("")
 
-    return "\n".join(lines)
+# id(tools) -> (tools, names); the list is kept so its id can't be reused
+_valid_names_cache: dict[int, tuple[list[dict[str, Any]], frozenset[str]]] = {}
+_VALID_NAMES_CACHE_SIZE = 8
+
+
+def _get_valid_names(tools: list[dict[str, Any]]) -> frozenset[str]:
+    """Get the set of tool names for a tool list, cached by list identity."""
+    cached = _valid_names_cache.get(id(tools))
+    if cached is not None and cached[0] is tools:
+        return cached[1]
+
+    names = frozenset(t.get("name") for t in tools if t.get("name"))
+    if len(_valid_names_cache) >= _VALID_NAMES_CACHE_SIZE:
+        _valid_names_cache.clear()
+    _valid_names_cache[id(tools)] = (tools, names)
+    return names
 
 
 def parse_tool_calls_from_text(
@@ -90,11 +132,7 @@ def parse_tool_calls_from_text(
     remaining_text = text
 
     # Valid tool names if provided (defensively handle missing/empty names)
-    valid_names = (
-        {t.get("name") for t in tools if t.get("name")}
-        if tools
-        else None
-    )
+    valid_names = _get_valid_names(tools) if tools else None
 
     def try_parse_tool_call(json_str: str) -> ToolCall | None:
         """Try to parse a JSON string as a tool call."""
@@ -114,7 +152,7 @@ def parse_tool_calls_from_text(
                 tool_input = {}
 
             return ToolCall(
-                id=f"call_{uuid.uuid4().hex[:8]}",
+                id=f"call_{_ID_PREFIX}{next(_ID_COUNTER):x}",
                 name=name,
                 input=tool_input,
             )
@@ -136,7 +174,7 @@ def parse_tool_calls_from_text(
     # Pattern 2: ```json blocks with tool-like content
     pattern2 = r"```json\s*(.*?)\s*```"
     for match in re.findall(pattern2, text, re.DOTALL):
-        if '"name"' in match and '"input"' in match:
+        if _has_tool_markers(match):
             tool_call = try_parse_tool_call(match)
             if tool_call:
                 tool_calls.append(tool_call)
@@ -149,7 +187,7 @@ def parse_tool_calls_from_text(
     # Pattern 3: ``` blocks (no language) with tool-like content
     pattern3 = r"```\s*(.*?)\s*```"
     for match in re.findall(pattern3, text, re.DOTALL):
-        if '"name"' in match and '"input"' in match:
+        if _has_tool_markers(match):
             tool_call = try_parse_tool_call(match)
             if tool_call:
                 tool_calls.append(tool_call)
@@ -161,8 +199,12 @@ def parse_tool_calls_from_text(
 
     # Pattern 4: Raw JSON on its own line ({"name": "...", "input": ...})
     if not tool_calls:
-        pattern4 = r'^\s*(\{"name":\s*"[^"]+",\s*"input":\s*\{[^}]*\}\s*\})\s*$'
-        for match in re.findall(pattern4, text, re.MULTILINE):
+        for start, end in _scan_raw_json_objects(text):
+            if not _on_own_lines(text, start, end):
+                continue
+            match = text[start:end]
+            if not _has_tool_markers(match):
+                continue
             tool_call = try_parse_tool_call(match)
             if tool_call:
                 tool_calls.append(tool_call)
@@ -171,6 +213,70 @@ def parse_tool_calls_from_text(
     return remaining_text.strip(), tool_calls
 
 
+def _has_tool_markers(text: str) -> bool:
+    """Check whether text mentions both the "name" and "input" keys.
+
+    Stops at the first missing marker; the "input" search resumes after
+    "name", falling back to a full search for inputs listed first.
+    """
+    i = text.find('"name"')
+    if i < 0:
+        return False
+    return text.find('"input"', i + 6) >= 0 or text.find('"input"', 0, i) >= 0
+
+
+def _scan_raw_json_objects(text: str) -> list[tuple[int, int]]:
+    """Find spans of balanced top-level JSON objects in text.
+
+    Walks the string once with a stack of open-brace positions, skipping
+    braces that appear inside JSON strings, so nested input objects are
+    handled and there is no regex backtracking. A stray "{" that never
+    closes is simply left on the stack, so objects after it are still
+    found; a newline ends string tracking since JSON strings can't span
+    lines.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        List of (start, end) slice indices of each top-level {...} object
+    """
+    spans: list[tuple[int, int]] = []
+    open_braces: list[int] = []
+    in_string = False
+    escaped = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"' or ch == "\n":
+                in_string = False
+        elif ch == '"':
+            in_string = bool(open_braces)
+        elif ch == "{":
+            open_braces.append(i)
+        elif ch == "}" and open_braces:
+            start = open_braces.pop()
+            # Objects closed earlier inside this one are nested, not top-level
+            while spans and spans[-1][0] > start:
+                spans.pop()
+            spans.append((start, i + 1))
+
+    return spans
+
+
+def _on_own_lines(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] has only whitespace around it on its lines."""
+    line_start = text.rfind("\n", 0, start) + 1
+    line_end = text.find("\n", end)
+    if line_end == -1:
+        line_end = len(text)
+    return not text[line_start:start].strip() and not text[end:line_end].strip()
+
+
 def format_tool_result(tool_call_id: str, result: str) -> dict[str, Any]:
     """Format a tool result for inclusion in the conversation.
 
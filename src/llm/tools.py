@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from src.llm.tool_parser import format_tools_as_prompt
+
 # Portfolio tools for Kite MCP
 PORTFOLIO_TOOLS: list[dict[str, Any]] = [
     {
@@ -173,6 +175,15 @@ EVENTS_TOOLS: list[dict[str, Any]] = [
 ]
 
 
+ALL_TOOLS: list[dict[str, Any]] = PORTFOLIO_TOOLS + RAG_TOOLS + EVENTS_TOOLS
+
+# Prompt-based tool instructions for the default tool set, built once at import
+ALL_TOOLS_PROMPT: str = format_tools_as_prompt(ALL_TOOLS)
+
+
 def get_all_tools() -> list[dict[str, Any]]:
-    """Get all available tool definitions."""
-    return PORTFOLIO_TOOLS + RAG_TOOLS + EVENTS_TOOLS
+    """Get all available tool definitions.
+
+    Returns the shared module-level list; callers must not mutate it.
+    """
+    return ALL_TOOLS
@@ -1,11 +1,14 @@
 """Kite MCP client using FastMCP with session persistence."""
 
-import json
+import asyncio
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
 from fastmcp import Client
 from fastmcp.exceptions import ToolError
 
@@ -15,6 +18,14 @@ KITE_MCP_URL = "https://mcp.kite.trade/mcp"
 SESSION_DIR = Path.home() / ".portfolio-copilot"
 SESSION_FILE = SESSION_DIR / "kite_session.pkl"
 
+# Seconds a fetched profile is reused before asking the server again
+PROFILE_TTL = 30.0
+
+# Seconds a prefetched holdings result may still be handed to get_holdings
+HOLDINGS_PREFETCH_TTL = 30.0
+
+_LOGIN_URL_RE = re.compile(r"https://kite\.zerodha\.com/connect/login[^\s\)]+")
+
 
 def extract_text(result: Any) -> str:
     """Extract text from CallToolResult."""
@@ -34,8 +45,8 @@ def parse_json_response(text: str, default: Any = None) -> Any:
     if not text:
         return default
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(text)
+    except (orjson.JSONDecodeError, TypeError):
         return default
 
 
@@ -47,6 +58,57 @@ class LoginResult:
     message: str
 
 
+# Numeric holding fields projected into Holdings columns
+HOLDING_NUMERIC_FIELDS = (
+    "quantity",
+    "average_price",
+    "last_price",
+    "pnl",
+    "day_change",
+    "day_change_percentage",
+)
+
+
+@dataclass
+class Holdings:
+    """Column-oriented view of portfolio holdings.
+
+    Numeric fields are float64 arrays (float32 would lose paise on large
+    positions) so portfolio math can be vectorized; the original records are
+    kept for backward compatibility.
+    """
+
+    symbols: np.ndarray
+    quantity: np.ndarray
+    average_price: np.ndarray
+    last_price: np.ndarray
+    pnl: np.ndarray
+    day_change: np.ndarray
+    day_change_percentage: np.ndarray
+    records: list[dict]
+
+    @classmethod
+    def from_dicts(cls, holdings: list[dict]) -> "Holdings":
+        """Build columns from Kite holding dicts (missing values become 0)."""
+        n = len(holdings)
+        columns = {
+            field: np.fromiter(
+                (h.get(field) or 0.0 for h in holdings), dtype=np.float64, count=n
+            )
+            for field in HOLDING_NUMERIC_FIELDS
+        }
+        symbols = np.array([h.get("tradingsymbol", "") for h in holdings], dtype=object)
+        return cls(symbols=symbols, records=holdings, **columns)
+
+    def __len__(self) -> int:
+        """Return the number of holdings."""
+        return len(self.records)
+
+    def to_dicts(self) -> list[dict]:
+        """Return the holdings as the original list of dicts."""
+        return self.records
+
+
 class AuthenticationError(Exception):
     """Raised when authentication is required."""
 
@@ -58,15 +120,25 @@ class KiteClient:
         self._client: Client | None = None
         self._connected: bool = False
         self._logged_in: bool = False
+        self._profile_cache: tuple[float, dict] | None = None
+        self._tools_cache: list[str] | None = None
+        self._holdings_prefetch: tuple[float, asyncio.Task[list[dict]]] | None = None
+        # Serializes connection setup when tools are called concurrently
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Establish connection to Kite MCP."""
-        if self._client is None or not self._connected:
-            if self._client is not None:
-                await self.disconnect()
-            self._client = Client(KITE_MCP_URL)
-            await self._client.__aenter__()
-            self._connected = True
+        if self._client is not None and self._connected:
+            return
+
+        async with self._connect_lock:
+            if self._client is None or not self._connected:
+                if self._client is not None:
+                    await self.disconnect()
+                self._client = Client(KITE_MCP_URL)
+                self._tools_cache = None
+                await self._client.__aenter__()
+                self._connected = True
 
     async def disconnect(self) -> None:
         """Close the connection."""
@@ -74,6 +146,7 @@ class KiteClient:
             await self._client.__aexit__(None, None, None)
             self._connected = False
         self._client = None
+        self._tools_cache = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -95,6 +168,8 @@ class KiteClient:
             except ToolError as e:
                 if "log in first" in str(e).lower() or "session" in str(e).lower():
                     self._logged_in = False
+                    self._profile_cache = None
+                    self._holdings_prefetch = None
                     raise AuthenticationError("Not logged in. Run 'login' first.") from e
                 raise
             except Exception as e:
@@ -116,10 +191,9 @@ class KiteClient:
             return True
 
         try:
-            # Try to get profile - this is a lightweight call
-            text = await self._call_tool("get_profile")
-            data = parse_json_response(text, {})
-            if data and isinstance(data, dict) and data.get("user_id"):
+            # Try to get profile - served from cache within PROFILE_TTL
+            data = await self.get_profile()
+            if data.get("user_id"):
                 self._logged_in = True
                 return True
         except (AuthenticationError, ToolError):
@@ -131,19 +205,45 @@ class KiteClient:
     async def get_profile(self) -> dict:
         """Get user profile information.
 
+        A logged-in profile (one with a user_id) is cached for PROFILE_TTL
+        seconds; anything else is refetched so a fresh login shows up at once.
+
         Returns:
             Dict with user_id, user_name, email, etc.
         """
+        if self._profile_cache is not None:
+            fetched_at, cached = self._profile_cache
+            if time.monotonic() - fetched_at < PROFILE_TTL:
+                return cached
+
         text = await self._call_tool("get_profile")
         data = parse_json_response(text, {})
-        return data if isinstance(data, dict) else {}
+        if not isinstance(data, dict):
+            return {}
+        if data.get("user_id"):
+            self._profile_cache = (time.monotonic(), data)
+        return data
+
+    async def get_login_profile(self) -> dict | None:
+        """Check login status and fetch the profile in a single round trip.
+
+        Returns:
+            The user profile if logged in, otherwise None
+        """
+        try:
+            data = await self.get_profile()
+        except (AuthenticationError, ToolError):
+            data = {}
+
+        self._logged_in = bool(data.get("user_id"))
+        return data if self._logged_in else None
 
     async def login(self) -> LoginResult:
         """Get login URL for Kite OAuth."""
         text = await self._call_tool("login")
 
         # Extract URL from the response
-        url_match = re.search(r"https://kite\.zerodha\.com/connect/login[^\s\)]+", text)
+        url_match = _LOGIN_URL_RE.search(text)
         url = url_match.group(0) if url_match else ""
 
         return LoginResult(url=url, message=text)
@@ -153,19 +253,61 @@ class KiteClient:
         self._logged_in = True
 
     async def list_tools(self) -> list[str]:
-        """List available MCP tools."""
+        """List available MCP tools (cached for the lifetime of the connection)."""
         await self.connect()
-        tools = await self._client.list_tools()
-        return [tool.name for tool in tools]
+        if self._tools_cache is None:
+            tools = await self._client.list_tools()
+            self._tools_cache = [tool.name for tool in tools]
+        return list(self._tools_cache)
 
     # Portfolio Tools
 
     async def get_holdings(self) -> list[dict]:
-        """Fetch portfolio holdings (long-term DEMAT holdings)."""
+        """Fetch portfolio holdings (long-term DEMAT holdings).
+
+        A prefetch started within HOLDINGS_PREFETCH_TTL is consumed instead
+        of making a new call.
+        """
+        prefetch, self._holdings_prefetch = self._holdings_prefetch, None
+        if prefetch is not None:
+            started_at, task = prefetch
+            if time.monotonic() - started_at < HOLDINGS_PREFETCH_TTL:
+                return await task
+            task.cancel()
+
+        return await self._fetch_holdings()
+
+    async def prefetch_holdings(self) -> None:
+        """Start fetching holdings in the background for the next get_holdings.
+
+        Lets the round trip overlap with work that precedes a query known to
+        need holdings, such as the user typing a stock name. A prefetch that
+        is still fresh is kept; a stale one is cancelled and replaced.
+        """
+        if self._holdings_prefetch is not None:
+            started_at, stale = self._holdings_prefetch
+            if time.monotonic() - started_at < HOLDINGS_PREFETCH_TTL:
+                return
+            stale.cancel()
+
+        task = asyncio.create_task(self._fetch_holdings())
+        # Mark failures as retrieved in case the prefetch is never consumed
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._holdings_prefetch = (time.monotonic(), task)
+
+    async def _fetch_holdings(self) -> list[dict]:
         text = await self._call_tool("get_holdings")
         data = parse_json_response(text, [])
         return data if isinstance(data, list) else []
 
+    async def get_holdings_columns(self) -> Holdings:
+        """Fetch portfolio holdings as numeric columns for vectorized math.
+
+        Always makes a fresh call, leaving any prefetch for the agent query
+        it was started for.
+        """
+        return Holdings.from_dicts(await self._fetch_holdings())
+
     async def get_positions(self) -> dict:
         """Fetch current trading positions (net and day).
 
@@ -186,6 +328,19 @@ class KiteClient:
         data = parse_json_response(text, {})
         return data if isinstance(data, dict) else {}
 
+    async def get_portfolio_bundle(self) -> dict:
+        """Fetch holdings, positions and margins concurrently.
+
+        Returns:
+            Dict with 'holdings', 'positions' and 'margins' keys
+        """
+        holdings, positions, margins = await asyncio.gather(
+            self.get_holdings(),
+            self.get_positions(),
+            self.get_margins(),
+        )
+        return {"holdings": holdings, "positions": positions, "margins": margins}
+
     # Market Data Tools
 
     async def get_quotes(self, instruments: list[str]) -> dict:
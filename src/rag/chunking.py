@@ -3,6 +3,10 @@
 import re
 from dataclasses import dataclass
 
+_WORD_RE = re.compile(r"\S+")
+# Sentence terminator plus the whitespace run that follows it (no lookbehind)
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]\s+")
+
 
 @dataclass
 class Chunk:
@@ -32,11 +36,11 @@ def chunk_by_tokens(
     # Using re.finditer to capture exact positions in original text
     words = []
     word_start_offsets = []
-    
-    for match in re.finditer(r'\S+', text):
+
+    for match in _WORD_RE.finditer(text):
         words.append(match.group())
         word_start_offsets.append(match.start())
-    
+
     chunks = []
 
     if len(words) <= chunk_size:
@@ -47,8 +51,7 @@ def chunk_by_tokens(
 
     while start < len(words):
         end = min(start + chunk_size, len(words))
-        chunk_words = words[start:end]
-        chunk_text = " ".join(chunk_words)
+        chunk_text = " ".join(words[start:end])
 
         # Calculate character positions using original offsets
         char_start = word_start_offsets[start]
@@ -69,6 +72,21 @@ def chunk_by_tokens(
     return chunks
 
 
+def _sentence_spans(text: str) -> list[tuple[int, int]]:
+    """Find (start, end) spans of sentences in text.
+
+    Equivalent to splitting on whitespace that follows '.', '!' or '?',
+    but returns index pairs instead of materializing the pieces.
+    """
+    spans = []
+    start = 0
+    for match in _SENTENCE_BREAK_RE.finditer(text):
+        spans.append((start, match.start() + 1))
+        start = match.end()
+    spans.append((start, len(text)))
+    return spans
+
+
 def chunk_by_sentences(
     text: str,
     max_chunk_size: int = 512,
@@ -82,7 +100,7 @@ def chunk_by_sentences(
         min_chunk_size: Minimum words before starting new chunk
     """
     # Split by sentence endings
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = [text[start:end] for start, end in _sentence_spans(text)]
     chunks = []
     current_chunk: list[str] = []
     current_size = 0
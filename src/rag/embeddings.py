@@ -1,54 +1,185 @@
 """Embedding generation using Sentence Transformers."""
 
+import hashlib
 import os
+import threading
 import warnings
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
-# Suppress HuggingFace/transformers noise before importing
+import numpy as np
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+    from src.rag.chunking import Chunk
+
+# Suppress HuggingFace/transformers noise; set at import so the variables are
+# in place before any library (including chromadb) imports the HF stack
 os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
 os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 os.environ.setdefault("HF_HUB_DISABLE_SYMLINKS_WARNING", "1")
 os.environ.setdefault("TRANSFORMERS_VERBOSITY", "error")
 os.environ.setdefault("TRANSFORMERS_NO_ADVISORY_WARNINGS", "1")
 
-# Suppress various warnings
-warnings.filterwarnings("ignore", message=".*HF_TOKEN.*")
-warnings.filterwarnings("ignore", message=".*unauthenticated.*")
-warnings.filterwarnings("ignore", message=".*LOAD REPORT.*")
-warnings.filterwarnings("ignore", category=FutureWarning)
-warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+DEFAULT_BATCH_SIZE = 64
+EMBED_CACHE_SIZE = 4096
 
-# Import with suppressed output
-import transformers  # noqa: E402
+# Set to "1"/"true" to run the embedding model with int8 dynamic quantization
+ENV_EMBEDDING_QUANTIZE = "EMBEDDING_QUANTIZE"
 
-transformers.logging.set_verbosity_error()
 
-from sentence_transformers import SentenceTransformer  # noqa: E402
+# Whether the warning/logging setup in _configure_once has already run
+_configured = False
 
-DEFAULT_MODEL = "all-MiniLM-L6-v2"
-EMBEDDING_DIM = 384
+
+def _configure_once() -> None:
+    """Install warning filters and quiet transformers before the first model load.
+
+    Runs at most once per process so repeated model construction doesn't
+    keep prepending to the warnings filter list.
+    """
+    global _configured
+    if _configured:
+        return
+
+    warnings.filterwarnings("ignore", message=".*HF_TOKEN.*")
+    warnings.filterwarnings("ignore", message=".*unauthenticated.*")
+    warnings.filterwarnings("ignore", message=".*LOAD REPORT.*")
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
+
+    import transformers
+
+    transformers.logging.set_verbosity_error()
+    _configured = True
+
+
+def _quantize_int8(model: "SentenceTransformer") -> "SentenceTransformer":
+    """Apply int8 dynamic quantization to the model's Linear layers (CPU only).
+
+    Weights are stored as int8 and activations are quantized on the fly, so
+    the transformer GEMMs run through the int8 kernels (VNNI where available).
+    """
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
 
 
 class EmbeddingModel:
     """Wrapper for sentence transformer embeddings."""
 
-    def __init__(self, model_name: str = DEFAULT_MODEL):
+    def __init__(self, model_name: str = DEFAULT_MODEL, quantize: bool | None = None):
+        """Load the embedding model.
+
+        Args:
+            model_name: Sentence Transformers model name
+            quantize: Use int8 dynamic quantization on CPU (defaults to the
+                EMBEDDING_QUANTIZE environment variable)
+        """
+        _configure_once()
+        # Deferred so importing src.rag doesn't pull in torch
+        from sentence_transformers import SentenceTransformer
+
         self._model = SentenceTransformer(model_name)
+        if quantize is None:
+            quantize = os.getenv(ENV_EMBEDDING_QUANTIZE, "").lower() in ("1", "true", "yes")
+        if quantize and self._model.device.type == "cpu":
+            self._model = _quantize_int8(self._model)
         self._dim = self._model.get_sentence_embedding_dimension()
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # embed runs on worker threads (asyncio.to_thread); guards the LRU order
+        self._cache_lock = threading.Lock()
 
     @property
     def dimension(self) -> int:
         """Return embedding dimension."""
         return self._dim
 
-    def embed(self, text: str) -> list[float]:
-        """Generate embedding for a single text."""
-        embedding = self._model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
-
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for multiple texts."""
-        embeddings = self._model.encode(texts, convert_to_numpy=True)
-        return embeddings.tolist()
+    def embed(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text.
+
+        Results are kept in an LRU cache keyed by a hash of the text, so
+        repeated queries skip the model forward pass. Cached arrays are
+        read-only since they are shared between callers. The cache is
+        locked, but the model call runs outside the lock.
+
+        Returns:
+            float32 array of shape (dim,)
+        """
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        embedding = np.asarray(
+            self._model.encode(text, convert_to_numpy=True, normalize_embeddings=True),
+            dtype=np.float32,
+        )
+        embedding.setflags(write=False)
+
+        with self._cache_lock:
+            self._cache[key] = embedding
+            if len(self._cache) > EMBED_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return embedding
+
+    def embed_batch(
+        self,
+        texts: list[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        normalize: bool = True,
+    ) -> np.ndarray:
+        """Generate embeddings for multiple texts in batched forward passes.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts per forward pass
+            normalize: L2-normalize the embeddings
+
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        embeddings = self._model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=normalize,
+            show_progress_bar=False,
+        )
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), self._dim)
+
+    def embed_chunks_pooled(self, chunks: list["Chunk"]) -> np.ndarray:
+        """Embed a document's chunks and pool them into one document vector.
+
+        All chunks are encoded in a single batched pass, then averaged with
+        each chunk weighted by its word count and L2-normalized.
+
+        Args:
+            chunks: Chunks of one document
+
+        Returns:
+            float32 array of shape (dim,)
+        """
+        embeddings = self.embed_batch([c.text for c in chunks], normalize=False)
+        # Count words the way chunking does (runs of non-whitespace); the
+        # floor of 1 keeps an empty chunk from zeroing the total weight
+        weights = np.fromiter(
+            (max(len(c.text.split()), 1) for c in chunks),
+            dtype=np.float32,
+            count=len(chunks),
+        )
+        pooled = (embeddings * weights[:, None]).sum(axis=0) / weights.sum()
+        norm = np.linalg.norm(pooled)
+        if norm > 0:
+            pooled /= norm
+        return pooled
 
 
 # Singleton instance for reuse
@@ -63,11 +194,16 @@ def get_embedding_model() -> EmbeddingModel:
     return _embedding_model
 
 
-def embed_text(text: str) -> list[float]:
+def embed_text(text: str) -> np.ndarray:
     """Convenience function to embed a single text."""
     return get_embedding_model().embed(text)
 
 
-def embed_texts(texts: list[str]) -> list[list[float]]:
+def embed_texts(texts: list[str]) -> np.ndarray:
     """Convenience function to embed multiple texts."""
     return get_embedding_model().embed_batch(texts)
+
+
+def embed_chunks_pooled(chunks: list["Chunk"]) -> np.ndarray:
+    """Convenience function to embed chunks into one pooled vector."""
+    return get_embedding_model().embed_chunks_pooled(chunks)
@@ -1,10 +1,12 @@
 """Retriever for semantic search over news articles."""
 
+import io
 from dataclasses import dataclass
+from typing import TextIO
 
 import structlog
 
-from src.rag.vector_store import VectorStore, get_vector_store
+from src.rag.vector_store import SearchResult, VectorStore, get_vector_store
 
 log = structlog.get_logger()
 
@@ -22,13 +24,36 @@ class RetrievalResult:
 
     def to_context_string(self) -> str:
         """Format as context string for LLM."""
-        header = f"[{self.source}]"
+        buf = io.StringIO()
+        self.write_context(buf)
+        return buf.getvalue()
+
+    def write_context(self, out: TextIO) -> None:
+        """Write the context string for LLM directly to a text stream."""
+        out.write("[")
+        out.write(self.source)
+        out.write("]")
         if self.symbol:
-            header += f" [{self.symbol}]"
+            out.write(" [")
+            out.write(self.symbol)
+            out.write("]")
         if self.title:
-            header += f" {self.title}"
-
-        return f"{header}\n{self.content}\nSource: {self.url}"
+            out.write(" ")
+            out.write(self.title)
+        out.write("\n")
+        out.write(self.content)
+        out.write("\nSource: ")
+        out.write(self.url)
+
+    def context_length(self) -> int:
+        """Return len(self.to_context_string()) without building the string."""
+        # "[" + "]" + "\n" + "\nSource: "
+        length = len(self.source) + len(self.content) + len(self.url) + 12
+        if self.symbol:
+            length += len(self.symbol) + 3
+        if self.title:
+            length += len(self.title) + 1
+        return length
 
 
 class NewsRetriever:
@@ -59,27 +84,64 @@ class NewsRetriever:
             top_k=top_k,
             symbol=symbol,
             source=source,
+            min_score=min_score,
+        )
+
+        retrieval_results = self._to_retrieval_results(results)
+
+        log.info("rag_search", query=query[:60], top_k=top_k, symbol=symbol, results=len(retrieval_results))
+        return retrieval_results
+
+    async def search_batch(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        symbols: list[str | None] | None = None,
+        source: str | None = None,
+        min_score: float = 0.3,
+    ) -> list[list[RetrievalResult]]:
+        """Search several queries at once, e.g. one per portfolio holding.
+
+        Args:
+            queries: Search queries
+            top_k: Max results per query
+            symbols: Optional per-query stock symbol filters
+            source: Filter by news source
+            min_score: Minimum similarity score threshold
+
+        Returns:
+            One result list per query, in query order
+        """
+        batches = await self._store.search_many(
+            queries,
+            top_k=top_k,
+            symbols=symbols,
+            source=source,
+            min_score=min_score,
         )
+        return [self._to_retrieval_results(results) for results in batches]
 
-        # Filter by score and convert to RetrievalResult
+    @staticmethod
+    def _to_retrieval_results(results: list[SearchResult]) -> list[RetrievalResult]:
+        """Convert search results to RetrievalResults."""
         retrieval_results: list[RetrievalResult] = []
 
-        for r in results:
-            if r.score < min_score:
-                continue
+        append = retrieval_results.append
 
-            retrieval_results.append(
+        for r in results:
+            doc = r.document
+            get = doc.metadata.get
+            append(
                 RetrievalResult(
-                    content=r.document.content,
-                    title=r.document.metadata.get("title", ""),
-                    source=r.document.metadata.get("source", "unknown"),
-                    url=r.document.metadata.get("url", ""),
-                    symbol=r.document.metadata.get("symbol") or None,
+                    content=doc.content,
+                    title=get("title", ""),
+                    source=get("source", "unknown"),
+                    url=get("url", ""),
+                    symbol=get("symbol") or None,
                     score=r.score,
                 )
             )
 
-        log.info("rag_search", query=query[:60], top_k=top_k, symbol=symbol, results=len(retrieval_results))
         return retrieval_results
 
     def search_for_context(
@@ -102,22 +164,22 @@ class NewsRetriever:
         if not results:
             return ""
 
-        context_parts = []
-        total_length = 0
+        buf = io.StringIO()
+        remaining = max_context_length
         separator = "\n\n---\n\n"
 
-        for r in results:
-            context_str = r.to_context_string()
-            separator_length = len(separator) if context_parts else 0
-            projected_length = total_length + len(context_str) + separator_length
-
-            if projected_length > max_context_length:
+        for i, r in enumerate(results):
+            # Check the budget before formatting anything for this result
+            needed = r.context_length() + (len(separator) if i else 0)
+            if needed > remaining:
                 break
 
-            context_parts.append(context_str)
-            total_length += len(context_str) + separator_length
+            if i:
+                buf.write(separator)
+            r.write_context(buf)
+            remaining -= needed
 
-        return separator.join(context_parts)
+        return buf.getvalue()
 
     def get_document_count(self) -> int:
         """Get total number of documents in store."""
@@ -1,22 +1,37 @@
 """ChromaDB vector store interface."""
 
-import uuid
+import asyncio
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import chromadb
+import numpy as np
 import structlog
 from chromadb.config import Settings
 
-from src.rag.embeddings import embed_text, embed_texts
+from src.rag.chunking import Chunk
+from src.rag.embeddings import embed_chunks_pooled, embed_text, embed_texts
 
 log = structlog.get_logger()
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "vector_store"
 COLLECTION_NAME = "news_articles"
 
+# HNSW index parameters applied when a collection is first created:
+# graph degree, and beam widths used while building and while querying
+HNSW_M = 32
+HNSW_CONSTRUCTION_EF = 128
+HNSW_SEARCH_EF = 64
+
+# Embeddings are L2-normalized before insert, so inner product equals cosine
+# similarity without per-candidate norm computations. Chroma reports ip
+# distance as 1 - dot, so scores are 1 - distance in either space; existing
+# collections keep the space they were created with.
+HNSW_SPACE = "ip"
+
 
 @dataclass
 class Document:
@@ -25,7 +40,7 @@ class Document:
     id: str
     content: str
     metadata: dict[str, Any]
-    embedding: list[float] | None = None
+    embedding: np.ndarray | None = None  # L2-normalized
 
     @classmethod
     def create(
@@ -36,18 +51,30 @@ class Document:
         published_at: datetime | None = None,
         title: str | None = None,
         url: str | None = None,
+        chunk_idx: int | None = None,
     ) -> "Document":
-        """Create a new document with auto-generated ID."""
+        """Create a new document with a content-derived ID.
+
+        The ID hashes source, symbol, URL, chunk index and content, so
+        re-ingesting the same article chunk upserts over the existing entry
+        instead of duplicating it, while the same article stored for another
+        symbol (or a repeated chunk text) keeps its own entry.
+        """
+        chunk_key = "" if chunk_idx is None else chunk_idx
+        key = f"{source}\0{symbol or ''}\0{url or ''}\0{chunk_key}\0{content}".encode()
+        metadata: dict[str, Any] = {
+            "source": source,
+            "symbol": symbol or "",
+            "published_at": published_at.isoformat() if published_at else "",
+            "title": title or "",
+            "url": url or "",
+        }
+        if chunk_idx is not None:
+            metadata["chunk_idx"] = chunk_idx
         return cls(
-            id=str(uuid.uuid4()),
+            id=hashlib.blake2b(key, digest_size=16).hexdigest(),
             content=content,
-            metadata={
-                "source": source,
-                "symbol": symbol or "",
-                "published_at": published_at.isoformat() if published_at else "",
-                "title": title or "",
-                "url": url or "",
-            },
+            metadata=metadata,
         )
 
 
@@ -76,7 +103,12 @@ class VectorStore:
         )
         self._collection = self._client.get_or_create_collection(
             name=collection,
-            metadata={"hnsw:space": "cosine"},
+            metadata={
+                "hnsw:space": HNSW_SPACE,
+                "hnsw:M": HNSW_M,
+                "hnsw:construction_ef": HNSW_CONSTRUCTION_EF,
+                "hnsw:search_ef": HNSW_SEARCH_EF,
+            },
         )
 
     def add_document(self, doc: Document) -> None:
@@ -86,16 +118,30 @@ class VectorStore:
 
         self._collection.upsert(
             ids=[doc.id],
-            embeddings=[doc.embedding],
+            embeddings=doc.embedding[None, :],
             documents=[doc.content],
             metadatas=[doc.metadata],
         )
 
+    def add_article(self, doc: Document, chunks: list[Chunk]) -> None:
+        """Add a whole article as one document with a chunk-pooled embedding.
+
+        Args:
+            doc: Article-level document (content is the full article)
+            chunks: Chunks of the article, embedded in one batch and pooled
+        """
+        if chunks:
+            doc.embedding = embed_chunks_pooled(chunks)
+        self.add_document(doc)
+
     def add_documents(self, docs: list[Document]) -> None:
         """Add multiple documents to the store."""
         if not docs:
             return
 
+        # Chroma rejects repeated IDs within one upsert; keep the last copy
+        docs = list({doc.id: doc for doc in docs}.values())
+
         # Generate embeddings for docs without them
         texts_to_embed = []
         indices_to_embed = []
@@ -105,25 +151,86 @@ class VectorStore:
                 texts_to_embed.append(doc.content)
                 indices_to_embed.append(i)
 
-        if texts_to_embed:
+        if len(texts_to_embed) == len(docs):
+            # Common case: embed everything in one batch and upsert the matrix
             embeddings = embed_texts(texts_to_embed)
-            for idx, embedding in zip(indices_to_embed, embeddings):
-                docs[idx].embedding = embedding
+            for doc, embedding in zip(docs, embeddings):
+                doc.embedding = embedding
+        else:
+            if texts_to_embed:
+                for idx, embedding in zip(indices_to_embed, embed_texts(texts_to_embed)):
+                    docs[idx].embedding = embedding
+            embeddings = np.stack([doc.embedding for doc in docs])
 
         self._collection.upsert(
             ids=[doc.id for doc in docs],
-            embeddings=[doc.embedding for doc in docs],
+            embeddings=embeddings,
             documents=[doc.content for doc in docs],
             metadatas=[doc.metadata for doc in docs],
         )
         log.info("vector_store_add", count=len(docs))
 
+    @staticmethod
+    def _build_where(symbol: str | None, source: str | None) -> dict[str, Any] | None:
+        """Build a Chroma where filter for optional symbol/source constraints."""
+        conditions = []
+
+        if symbol:
+            conditions.append({"symbol": {"$eq": symbol}})
+
+        if source:
+            conditions.append({"source": {"$eq": source}})
+
+        if len(conditions) == 1:
+            return conditions[0]
+        if len(conditions) > 1:
+            return {"$and": conditions}
+        return None
+
+    @staticmethod
+    def _to_search_results(
+        results: dict[str, Any],
+        row: int,
+        min_score: float | None = None,
+    ) -> list[SearchResult]:
+        """Convert one query row of a Chroma query response to SearchResults.
+
+        Results scoring below min_score are dropped before any objects are built.
+        """
+        ids = results["ids"][row] if results["ids"] else []
+        if not ids:
+            return []
+
+        n = len(ids)
+        documents = results["documents"][row] if results["documents"] else [""] * n
+        metadatas = results["metadatas"][row] if results["metadatas"] else [{}] * n
+
+        # ChromaDB returns distances, convert to similarity scores in one pass
+        if results["distances"]:
+            scores = 1.0 - np.asarray(results["distances"][row], dtype=np.float64)
+        else:
+            scores = np.ones(n)
+
+        rows = zip(ids, documents, metadatas, scores.tolist())
+        if min_score is not None:
+            keep = (scores >= min_score).tolist()
+            rows = (r for r, k in zip(rows, keep) if k)
+
+        return [
+            SearchResult(
+                document=Document(id=doc_id, content=content, metadata=metadata),
+                score=score,
+            )
+            for doc_id, content, metadata, score in rows
+        ]
+
     def search(
         self,
         query: str,
         top_k: int = 5,
         symbol: str | None = None,
         source: str | None = None,
+        min_score: float | None = None,
     ) -> list[SearchResult]:
         """Search for similar documents.
 
@@ -132,53 +239,76 @@ class VectorStore:
             top_k: Number of results to return
             symbol: Filter by stock symbol
             source: Filter by news source
+            min_score: Drop results with a lower similarity score
         """
         query_embedding = embed_text(query)
 
-        # Build where filter
-        where_filter = None
-        conditions = []
-
-        if symbol:
-            conditions.append({"symbol": {"$eq": symbol}})
-
-        if source:
-            conditions.append({"source": {"$eq": source}})
-
-        if len(conditions) == 1:
-            where_filter = conditions[0]
-        elif len(conditions) > 1:
-            where_filter = {"$and": conditions}
-
         results = self._collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embedding[None, :],
             n_results=top_k,
-            where=where_filter,
+            where=self._build_where(symbol, source),
             include=["documents", "metadatas", "distances"],
         )
 
-        search_results = []
-
-        if results["ids"] and results["ids"][0]:
-            for i, doc_id in enumerate(results["ids"][0]):
-                # ChromaDB returns distances, convert to similarity score
-                distance = results["distances"][0][i] if results["distances"] else 0
-                score = 1 - distance  # Cosine distance to similarity
-
-                search_results.append(
-                    SearchResult(
-                        document=Document(
-                            id=doc_id,
-                            content=results["documents"][0][i] if results["documents"] else "",
-                            metadata=results["metadatas"][0][i] if results["metadatas"] else {},
-                        ),
-                        score=score,
-                    )
-                )
+        search_results = self._to_search_results(results, 0, min_score)
 
         log.info("vector_store_search", top_k=top_k, symbol=symbol, results=len(search_results))
         return search_results
 
+    async def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        symbols: list[str | None] | None = None,
+        source: str | None = None,
+        min_score: float | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with one batched embedding pass.
+
+        Embedding and index lookups run in worker threads so the event loop
+        stays free. Queries sharing the same symbol filter are sent to the
+        index as a single batched query; different filters run concurrently.
+
+        Args:
+            queries: Search query texts
+            top_k: Number of results per query
+            symbols: Optional per-query stock symbol filters (same length as queries)
+            source: Filter by news source (applies to all queries)
+            min_score: Drop results with a lower similarity score
+
+        Returns:
+            One result list per query, in query order
+        """
+        if not queries:
+            return []
+
+        if symbols is None:
+            symbols = [None] * len(queries)
+
+        query_embeddings = await asyncio.to_thread(embed_texts, queries)
+
+        # Group query rows by filter so each group is one Chroma query
+        groups: dict[str | None, list[int]] = {}
+        for row, symbol in enumerate(symbols):
+            groups.setdefault(symbol, []).append(row)
+
+        async def query_group(symbol: str | None, rows: list[int]) -> None:
+            results = await asyncio.to_thread(
+                self._collection.query,
+                query_embeddings=query_embeddings[rows],
+                n_results=top_k,
+                where=self._build_where(symbol, source),
+                include=["documents", "metadatas", "distances"],
+            )
+            for i, row in enumerate(rows):
+                all_results[row] = self._to_search_results(results, i, min_score)
+
+        all_results: list[list[SearchResult]] = [[] for _ in queries]
+        await asyncio.gather(*(query_group(symbol, rows) for symbol, rows in groups.items()))
+
+        log.info("vector_store_search_many", queries=len(queries), top_k=top_k, groups=len(groups))
+        return all_results
+
     def delete_by_source(self, source: str) -> None:
         """Delete all documents from a specific source."""
         self._collection.delete(where={"source": {"$eq": source}})
@@ -3,13 +3,19 @@
 
 import argparse
 import asyncio
+import importlib
+import time
 import webbrowser
+from collections import Counter
 from collections.abc import Awaitable, Callable
-from typing import Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.prompt import Prompt
+from rich.spinner import Spinner
 from rich.table import Table
 
 from src.core.config import get_config, set_provider
@@ -17,8 +23,40 @@ from src.core.logging import setup_logging
 from src.llm.claude import PortfolioAssistant
 from src.mcp.kite_client import AuthenticationError, KiteClient
 
+if TYPE_CHECKING:
+    from src.agents.orchestrator import AgentOrchestrator
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 console = Console()
 
+# Minimum seconds between markdown re-renders while streaming a response
+LIVE_RENDER_INTERVAL = 0.1
+
+# Modules the command handlers import lazily; loaded in the background at startup
+WARM_MODULES = (
+    "src.agents.orchestrator",
+    "src.data.ingestion",
+    "src.data.scrapers.bse",
+)
+
+
+# Orchestrator shared by all commands, paired with the client it was built for
+_orchestrator: "tuple[KiteClient, AgentOrchestrator] | None" = None
+
+
+def _get_orchestrator(client: KiteClient) -> "AgentOrchestrator":
+    """Get the cached agent orchestrator for a client, creating it on first use."""
+    global _orchestrator
+    if _orchestrator is None or _orchestrator[0] is not client:
+        from src.agents.orchestrator import AgentOrchestrator
+
+        _orchestrator = (client, AgentOrchestrator(client))
+    return _orchestrator[1]
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -47,10 +85,25 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# Indexed by (value >= 0): red for negatives (and NaN), green otherwise
+_VALUE_FORMATS = ("[red]{:.2f}{}[/red]", "[green]{:.2f}{}[/green]")
+
+
 def format_value(value: float, suffix: str = "") -> str:
     """Format numeric value with color based on sign."""
-    color = "green" if value >= 0 else "red"
-    return f"[{color}]{value:.2f}{suffix}[/{color}]"
+    return _VALUE_FORMATS[value >= 0].format(value, suffix)
+
+
+# Holding fields shown by display_holdings, with defaults for missing keys
+_HOLDING_DEFAULTS = {
+    "tradingsymbol": "N/A",
+    "quantity": 0,
+    "average_price": 0,
+    "last_price": 0,
+    "pnl": 0,
+    "day_change_percentage": 0,
+}
+_holding_fields = itemgetter(*_HOLDING_DEFAULTS)
 
 
 def display_holdings(holdings: list[dict]) -> None:
@@ -67,14 +120,19 @@ def display_holdings(holdings: list[dict]) -> None:
     table.add_column("P&L", justify="right")
     table.add_column("Change %", justify="right")
 
+    add_row = table.add_row
     for h in holdings:
-        table.add_row(
-            h.get("tradingsymbol", "N/A"),
-            str(h.get("quantity", 0)),
-            f"{h.get('average_price', 0):.2f}",
-            f"{h.get('last_price', 0):.2f}",
-            format_value(h.get("pnl", 0)),
-            format_value(h.get("day_change_percentage", 0), "%"),
+        try:
+            symbol, qty, avg_price, ltp, pnl, change = _holding_fields(h)
+        except KeyError:
+            symbol, qty, avg_price, ltp, pnl, change = _holding_fields(_HOLDING_DEFAULTS | h)
+        add_row(
+            symbol,
+            str(qty),
+            f"{avg_price:.2f}",
+            f"{ltp:.2f}",
+            format_value(pnl),
+            format_value(change, "%"),
         )
 
     console.print(table)
@@ -101,14 +159,11 @@ async def handle_login(client: KiteClient, _assistant: PortfolioAssistant) -> No
     """Handle login flow."""
     # Check if already logged in
     with console.status("[bold green]Checking login status..."):
-        if await client.is_logged_in():
-            try:
-                profile = await client.get_profile()
-                user_name = profile.get("user_name", "User")
-                console.print(f"[green]Already logged in as {user_name}![/green]")
-                return
-            except Exception:
-                pass
+        profile = await client.get_login_profile()
+        if profile is not None:
+            user_name = profile.get("user_name", "User")
+            console.print(f"[green]Already logged in as {user_name}![/green]")
+            return
 
     with console.status("[bold green]Getting login URL..."):
         result = await client.login()
@@ -132,14 +187,11 @@ async def handle_login(client: KiteClient, _assistant: PortfolioAssistant) -> No
 
     # Verify login succeeded
     with console.status("[bold green]Verifying login..."):
-        if await client.is_logged_in():
+        profile = await client.get_login_profile()
+        if profile is not None:
             client.mark_logged_in()
-            try:
-                profile = await client.get_profile()
-                user_name = profile.get("user_name", "User")
-                console.print(f"[green]Successfully logged in as {user_name}![/green]")
-            except Exception:
-                console.print("[green]Successfully logged in![/green]")
+            user_name = profile.get("user_name", "User")
+            console.print(f"[green]Successfully logged in as {user_name}![/green]")
         else:
             console.print("[yellow]Login not detected yet. Try running 'login' again or use any command - it will prompt if needed.[/yellow]")
 
@@ -179,8 +231,8 @@ async def handle_whoami(client: KiteClient, _assistant: PortfolioAssistant) -> N
     """Show current login status and user info."""
     with console.status("[bold green]Checking login status..."):
         try:
-            if await client.is_logged_in():
-                profile = await client.get_profile()
+            profile = await client.get_login_profile()
+            if profile is not None:
                 console.print("\n[bold]Login Status:[/bold] [green]Logged In[/green]")
                 user_id = profile.get('user_id', 'N/A')
                 masked_id = user_id[:2] + '***' + user_id[-1] if len(user_id) > 3 else '***'
@@ -257,14 +309,12 @@ async def handle_search(_client: KiteClient, _assistant: PortfolioAssistant) ->
 
 async def handle_analyze(client: KiteClient, _assistant: PortfolioAssistant) -> None:
     """Run portfolio analysis agent."""
-    from src.agents.orchestrator import AgentOrchestrator
-
     query = Prompt.ask(
         "What would you like to analyze?",
         default="Analyze my worst performing stocks",
     )
 
-    orchestrator = AgentOrchestrator(client)
+    orchestrator = _get_orchestrator(client)
 
     console.print("\n[bold magenta]Portfolio Analysis Agent[/bold magenta]")
 
@@ -278,14 +328,12 @@ async def handle_analyze(client: KiteClient, _assistant: PortfolioAssistant) ->
 
 async def handle_research(client: KiteClient, _assistant: PortfolioAssistant) -> None:
     """Run stock research agent."""
-    from src.agents.orchestrator import AgentOrchestrator
-
     query = Prompt.ask(
         "Which stock to research?",
         default="Tell me about Reliance",
     )
 
-    orchestrator = AgentOrchestrator(client)
+    orchestrator = _get_orchestrator(client)
 
     console.print("\n[bold magenta]Stock Research Agent[/bold magenta]")
 
@@ -299,14 +347,12 @@ async def handle_research(client: KiteClient, _assistant: PortfolioAssistant) ->
 
 async def handle_context(client: KiteClient, _assistant: PortfolioAssistant) -> None:
     """Run market context agent."""
-    from src.agents.orchestrator import AgentOrchestrator
-
     query = Prompt.ask(
         "What would you like to understand?",
         default="Why did my portfolio move today?",
     )
 
-    orchestrator = AgentOrchestrator(client)
+    orchestrator = _get_orchestrator(client)
 
     console.print("\n[bold magenta]Market Context Agent[/bold magenta]")
 
@@ -320,14 +366,12 @@ async def handle_context(client: KiteClient, _assistant: PortfolioAssistant) ->
 
 async def handle_watchlist(client: KiteClient, _assistant: PortfolioAssistant) -> None:
     """Run watchlist suggestion agent."""
-    from src.agents.orchestrator import AgentOrchestrator
-
     query = Prompt.ask(
         "What kind of stocks are you looking for?",
         default="Suggest stocks for my watchlist",
     )
 
-    orchestrator = AgentOrchestrator(client)
+    orchestrator = _get_orchestrator(client)
 
     console.print("\n[bold magenta]Watchlist Suggestion Agent[/bold magenta]")
 
@@ -341,14 +385,12 @@ async def handle_watchlist(client: KiteClient, _assistant: PortfolioAssistant) -
 
 async def handle_fundamentals(client: KiteClient, _assistant: PortfolioAssistant) -> None:
     """Run fundamental analysis agent."""
-    from src.agents.orchestrator import AgentOrchestrator
-
     query = Prompt.ask(
         "Which stock to analyze?",
         default="Is Reliance a good buy?",
     )
 
-    orchestrator = AgentOrchestrator(client)
+    orchestrator = _get_orchestrator(client)
 
     console.print("\n[bold magenta]Fundamental Analysis Agent[/bold magenta]")
 
@@ -445,17 +487,10 @@ async def handle_status(_client: KiteClient, _assistant: PortfolioAssistant) ->
     results = collection.peek(limit=10)
 
     if results and results["ids"]:
-        # Count by source
-        sources: dict[str, int] = {}
-        symbols: dict[str, int] = {}
-
-        for meta in results["metadatas"]:
-            src = meta.get("source", "unknown")
-            sources[src] = sources.get(src, 0) + 1
-
-            sym = meta.get("symbol", "")
-            if sym:
-                symbols[sym] = symbols.get(sym, 0) + 1
+        # Count by source and symbol
+        metadatas = results["metadatas"]
+        sources = Counter(meta.get("source", "unknown") for meta in metadatas)
+        symbols = Counter(sym for meta in metadatas if (sym := meta.get("symbol", "")))
 
         console.print(f"\n[bold]Sources (sample of {len(results['ids'])}):[/bold]")
         for src, cnt in sources.items():
@@ -518,10 +553,8 @@ async def handle_chat(
     client: KiteClient,
 ) -> None:
     """Handle natural language chat with Claude or agents."""
-    from src.agents.orchestrator import AgentOrchestrator
-
     # Check if an agent should handle this query
-    orchestrator = AgentOrchestrator(client)
+    orchestrator = _get_orchestrator(client)
     should_use, agent_type = orchestrator.should_use_agent(user_input)
 
     if should_use and agent_type:
@@ -544,20 +577,29 @@ async def handle_chat(
         console.print()
         return
 
-    # Regular Claude chat - collect full response
-    response_text = ""
+    # Regular Claude chat - stream the response as markdown while it arrives
+    parts: list[str] = []
+    last_render = 0.0
 
     try:
-        with console.status("[bold green]Thinking..."):
+        console.print("\n[bold cyan]Assistant[/bold cyan]")
+        with Live(
+            Spinner("dots", text="[bold green]Thinking..."),
+            console=console,
+            vertical_overflow="visible",
+        ) as live:
             async for event in assistant.chat(user_input):
                 if event.type == "text":
-                    response_text += event.text
+                    parts.append(event.text)
+                    # Re-parsing markdown per token is quadratic; throttle renders
+                    now = time.monotonic()
+                    if now - last_render >= LIVE_RENDER_INTERVAL:
+                        live.update(Markdown("".join(parts)))
+                        last_render = now
                 elif event.type == "done":
                     break
 
-        # Print response with markdown formatting
-        console.print("\n[bold cyan]Assistant[/bold cyan]")
-        console.print(Markdown(response_text))
+            live.update(Markdown("".join(parts)))
         console.print()
 
     except AuthenticationError:
@@ -569,8 +611,8 @@ async def handle_chat(
 async def check_login_status(client: KiteClient) -> None:
     """Check and display login status at startup."""
     try:
-        if await client.is_logged_in():
-            profile = await client.get_profile()
+        profile = await client.get_login_profile()
+        if profile is not None:
             user_name = profile.get("user_name", "User")
             console.print(f"[green]Logged in as {user_name}[/green]\n")
         else:
@@ -579,8 +621,21 @@ async def check_login_status(client: KiteClient) -> None:
         console.print("[dim]Run 'login' to connect to your Kite account.[/dim]\n")
 
 
+async def warm_imports() -> None:
+    """Import handler modules in a worker thread so first commands don't wait on them."""
+
+    def import_all() -> None:
+        for module in WARM_MODULES:
+            importlib.import_module(module)
+
+    await asyncio.to_thread(import_all)
+
+
 async def async_main(args: argparse.Namespace) -> None:
     """Async main entry point."""
+    # Run new tasks eagerly so ones that finish without blocking skip a loop hop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Setup structured logging
     setup_logging(debug=args.debug, json_output=False)
 
@@ -626,15 +681,17 @@ async def async_main(args: argparse.Namespace) -> None:
     async with KiteClient() as client:
         assistant = PortfolioAssistant(client)
 
-        # Check login status at startup
-        await check_login_status(client)
+        # Check login status at startup while handler modules load in the background.
+        # Import errors are left for the handler that needs the module to report.
+        await asyncio.gather(
+            check_login_status(client),
+            warm_imports(),
+            return_exceptions=True,
+        )
 
         while True:
             try:
-                loop = asyncio.get_running_loop()
-                user_input = await loop.run_in_executor(
-                    None, lambda: Prompt.ask("[bold blue]You[/bold blue]")
-                )
+                user_input = await asyncio.to_thread(Prompt.ask, "[bold blue]You[/bold blue]")
                 cmd = user_input.lower().strip()
 
                 if cmd in ["exit", "quit", "q"]:
@@ -664,7 +721,9 @@ async def async_main(args: argparse.Namespace) -> None:
 def main() -> None:
     """Main CLI entry point."""
     args = parse_args()
-    asyncio.run(async_main(args))
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(async_main(args))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
 """Chat interface component."""
 
+import re
+from html import escape
+from typing import TYPE_CHECKING, Any
+
 import streamlit as st
 
-from src.agents.orchestrator import AgentOrchestrator
-from src.llm.claude import PortfolioAssistant
 from src.mcp.kite_client import AuthenticationError, KiteClient
-from src.ui.utils.async_bridge import run_async
+from src.ui.utils.async_bridge import iter_async, run_async
 from src.ui.utils.session import SessionManager
 
+if TYPE_CHECKING:
+    from src.agents.orchestrator import AgentOrchestrator
+    from src.llm.claude import PortfolioAssistant
+
 # User-friendly messages for common API errors
 API_ERROR_MESSAGES = {
     "overloaded_error": (
@@ -31,6 +37,52 @@ API_ERROR_MESSAGES = {
     ),
 }
 
+# One alternation over all error keys, one capture group per key in priority order
+_ERROR_MESSAGE_LIST = list(API_ERROR_MESSAGES.values())
+_ERROR_RE = re.compile("|".join(f"({re.escape(key)})" for key in API_ERROR_MESSAGES))
+
+# Category color mapping for styled event badges
+_EVENT_BADGE_COLORS = {
+    "board_meeting": "#f59e0b",
+    "dividend": "#10b981",
+    "acquisition": "#a855f7",
+    "merger": "#3b82f6",
+    "earnings": "#06b6d4",
+    "govt_policy": "#ef4444",
+    "other": "#6b7280",
+}
+
+# Static scaffolding around the event rows in _render_events_table
+_EVENTS_TABLE_HEADER = """
+    <div style="overflow-x:auto;">
+    <table style="width:100%;border-collapse:collapse;font-size:0.9em;">
+        <thead>
+            <tr style="border-bottom:2px solid #555;text-align:left;">
+                <th style="padding:10px 8px;width:30px;">#</th>
+                <th style="padding:10px 8px;">Symbol</th>
+                <th style="padding:10px 8px;">Date</th>
+                <th style="padding:10px 8px;">Category</th>
+                <th style="padding:10px 8px;">Title</th>
+                <th style="padding:10px 8px;text-align:center;">Link</th>
+            </tr>
+        </thead>
+        <tbody style="border-top:1px solid #333;">
+            """
+_EVENTS_ROW_TEMPLATE = """<tr style="border-bottom:1px solid #3333;">
+            <td style="padding:8px 8px;text-align:right;color:#888;">{i}</td>
+            <td style="padding:8px 8px;"><strong>{symbol}</strong></td>
+            <td style="padding:8px 8px;white-space:nowrap;">{date}</td>
+            <td style="padding:8px 8px;"><span style="background:{cat_color};color:white;padding:2px 8px;border-radius:10px;font-size:0.8em;white-space:nowrap;">{cat_label}</span></td>
+            <td style="padding:8px 8px;">{title}</td>
+            <td style="padding:8px 8px;text-align:center;">{link_html}</td>
+        </tr>"""
+_EVENTS_LINK_TEMPLATE = '<a href="{url}" target="_blank">BSE&nbsp;↗</a>'
+_EVENTS_TABLE_FOOTER = """
+        </tbody>
+    </table>
+    </div>
+    """
+
 
 def _get_friendly_error_message(error: Exception) -> str:
     """Convert API errors to user-friendly messages.
@@ -43,9 +95,10 @@ def _get_friendly_error_message(error: Exception) -> str:
     """
     error_str = str(error).lower()
 
-    for error_type, message in API_ERROR_MESSAGES.items():
-        if error_type in error_str:
-            return message
+    # Earlier keys win when several appear, matching dict order
+    group = min((m.lastindex for m in _ERROR_RE.finditer(error_str)), default=None)
+    if group is not None:
+        return _ERROR_MESSAGE_LIST[group - 1]
 
     # Default message for unknown errors
     return f"An error occurred: {error}"
@@ -53,8 +106,8 @@ def _get_friendly_error_message(error: Exception) -> str:
 
 def render_chat(
     kite_client: KiteClient,
-    assistant: PortfolioAssistant,
-    orchestrator: AgentOrchestrator,
+    assistant: "PortfolioAssistant",
+    orchestrator: "AgentOrchestrator",
 ) -> None:
     """Render the chat interface.
 
@@ -84,7 +137,8 @@ def _render_chat_history() -> None:
     for message in history:
         with st.chat_message(message.role):
             # Re-render events table from metadata if available
-            events = (message.metadata or {}).get("events") if message.metadata else None
+            metadata = message.metadata
+            events = metadata.get("events") if metadata else None
             if events:
                 _render_events_table(events)
             else:
@@ -95,8 +149,8 @@ def _render_chat_history() -> None:
 
 def _process_query(
     query: str,
-    assistant: PortfolioAssistant,
-    orchestrator: AgentOrchestrator,
+    assistant: "PortfolioAssistant",
+    orchestrator: "AgentOrchestrator",
 ) -> None:
     """Process a user query through agents or regular chat.
 
@@ -123,7 +177,7 @@ def _process_query(
 def _handle_agent_query(
     query: str,
     agent_type: str,
-    orchestrator: AgentOrchestrator,
+    orchestrator: "AgentOrchestrator",
 ) -> None:
     """Handle a query using an agent workflow.
 
@@ -166,30 +220,28 @@ def _handle_agent_query(
         SessionManager.add_message("assistant", error_msg)
 
 
-def _handle_regular_chat(query: str, assistant: PortfolioAssistant) -> None:
+def _handle_regular_chat(query: str, assistant: "PortfolioAssistant") -> None:
     """Handle a query using regular Claude chat.
 
     Args:
         query: The user's query
         assistant: The PortfolioAssistant
     """
-    try:
-        with st.spinner("Thinking..."):
-            # Collect the full response
-            response_text = ""
-
-            async def collect_response() -> str:
-                nonlocal response_text
-                async for event in assistant.chat(query):
-                    if event.type == "text":
-                        response_text += event.text
-                    elif event.type == "done":
-                        break
-                return response_text
 
-            response_text = run_async(collect_response())
+    def text_chunks():
+        """Yield response text as the assistant streams it."""
+        for event in iter_async(assistant.chat(query)):
+            if event.type == "text":
+                yield event.text
+            elif event.type == "done":
+                break
 
-        st.markdown(response_text)
+    try:
+        # Render text as it arrives; the spinner stays up until the stream ends
+        with st.spinner("Thinking..."):
+            result = st.write_stream(text_chunks())
+        # write_stream returns a list instead of a str when no text was streamed
+        response_text = result if isinstance(result, str) else "".join(map(str, result))
         SessionManager.add_message("assistant", response_text)
 
     except AuthenticationError:
@@ -209,9 +261,6 @@ def _render_events_table(events: list[dict]) -> None:
     Args:
         events: List of event dicts with title, category, date, url, symbol
     """
-    import pandas as pd
-    from src.data.scrapers.bse import CATEGORY_COLORS
-
     if not events:
         st.info("No corporate events found.")
         return
@@ -221,56 +270,50 @@ def _render_events_table(events: list[dict]) -> None:
     title = f"Corporate Events: {', '.join(sorted(symbols))}" if symbols else "Corporate Events"
     st.subheader(title)
 
-    # Category color mapping for styled badges
-    _CAT_BADGE_COLORS = {
-        "board_meeting": "#f59e0b",
-        "dividend": "#10b981",
-        "acquisition": "#a855f7",
-        "merger": "#3b82f6",
-        "earnings": "#06b6d4",
-        "govt_policy": "#ef4444",
-        "other": "#6b7280",
-    }
-
-    # Build HTML table
-    rows_html = ""
-    for i, e in enumerate(events, 1):
-        cat = e.get("category", "other")
-        cat_color = _CAT_BADGE_COLORS.get(cat, "#6b7280")
-        cat_label = cat.replace("_", " ").title()
-        url = e.get("url", "")
-        link_html = f'<a href="{url}" target="_blank">BSE&nbsp;↗</a>' if url else "—"
-
-        rows_html += f"""<tr style="border-bottom:1px solid #3333;">
-            <td style="padding:8px 8px;text-align:right;color:#888;">{i}</td>
-            <td style="padding:8px 8px;"><strong>{e.get('symbol', '')}</strong></td>
-            <td style="padding:8px 8px;white-space:nowrap;">{e.get('date', 'N/A')}</td>
-            <td style="padding:8px 8px;"><span style="background:{cat_color};color:white;padding:2px 8px;border-radius:10px;font-size:0.8em;white-space:nowrap;">{cat_label}</span></td>
-            <td style="padding:8px 8px;">{e.get('title', '')}</td>
-            <td style="padding:8px 8px;text-align:center;">{link_html}</td>
-        </tr>"""
+    # Rows are reduced to a hashable key so history re-renders hit the cache
+    rows = tuple(
+        (
+            e.get("symbol", ""),
+            e.get("date", "N/A"),
+            e.get("category", "other"),
+            e.get("title", ""),
+            e.get("url") or "",
+        )
+        for e in events
+    )
+    st.markdown(_build_events_html(rows), unsafe_allow_html=True)
 
-    table_html = f"""
-    <div style="overflow-x:auto;">
-    <table style="width:100%;border-collapse:collapse;font-size:0.9em;">
-        <thead>
-            <tr style="border-bottom:2px solid #555;text-align:left;">
-                <th style="padding:10px 8px;width:30px;">#</th>
-                <th style="padding:10px 8px;">Symbol</th>
-                <th style="padding:10px 8px;">Date</th>
-                <th style="padding:10px 8px;">Category</th>
-                <th style="padding:10px 8px;">Title</th>
-                <th style="padding:10px 8px;text-align:center;">Link</th>
-            </tr>
-        </thead>
-        <tbody style="border-top:1px solid #333;">
-            {rows_html}
-        </tbody>
-    </table>
-    </div>
-    """
 
-    st.markdown(table_html, unsafe_allow_html=True)
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_events_html(rows: tuple[tuple[Any, Any, str, Any, str], ...]) -> str:
+    """Build the events table HTML, cached across Streamlit reruns.
+
+    Args:
+        rows: (symbol, date, category, title, url) per event
+
+    Returns:
+        The table HTML
+    """
+    # Build HTML table rows from the pre-parsed template, joined once at the end
+    format_row = _EVENTS_ROW_TEMPLATE.format_map
+    row_parts = []
+    for i, (symbol, date, cat, title, url) in enumerate(rows, 1):
+        # Event fields come from scraped pages; escape them before embedding as HTML
+        row_parts.append(format_row({
+            "i": i,
+            "symbol": escape(str(symbol)),
+            "date": escape(str(date)),
+            "cat_color": _EVENT_BADGE_COLORS.get(cat, "#6b7280"),
+            "cat_label": escape(cat.replace("_", " ").title()),
+            "title": escape(str(title)),
+            "link_html": (
+                _EVENTS_LINK_TEMPLATE.format(url=escape(url))
+                if url.startswith(("http://", "https://"))
+                else "—"
+            ),
+        }))
+
+    return _EVENTS_TABLE_HEADER + "".join(row_parts) + _EVENTS_TABLE_FOOTER
 
 
 def render_empty_chat_state() -> None:
@@ -1,11 +1,51 @@
 """Login component for Kite OAuth flow."""
 
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
 import streamlit as st
 
 from src.mcp.kite_client import KiteClient
 from src.ui.utils.async_bridge import run_async
 from src.ui.utils.session import SessionManager
 
+T = TypeVar("T")
+
+# Attempts and initial delay (seconds) when verifying login hits transient errors
+VERIFY_ATTEMPTS = 4
+VERIFY_BASE_DELAY = 0.5
+
+
+async def _with_backoff(
+    make_call: Callable[[], Awaitable[T]],
+    attempts: int = VERIFY_ATTEMPTS,
+    base_delay: float = VERIFY_BASE_DELAY,
+) -> T:
+    """Await a call, retrying failures with jittered exponential backoff.
+
+    Args:
+        make_call: Factory returning a fresh awaitable for each attempt
+        attempts: Maximum number of attempts
+        base_delay: Delay before the first retry, doubled after each one
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        Exception: The last error once all attempts fail
+    """
+    delay = base_delay
+    for _ in range(attempts - 1):
+        try:
+            return await make_call()
+        except Exception:
+            # Jitter spreads retries out so repeated clicks don't arrive in bursts
+            await asyncio.sleep(delay + random.random() * delay)
+            delay *= 2
+    return await make_call()
+
 
 def render_login(kite_client: KiteClient) -> None:
     """Render the login component in the sidebar.
@@ -71,10 +111,10 @@ def _verify_login(kite_client: KiteClient) -> None:
     """Verify that login was successful."""
     with st.spinner("Verifying login..."):
         try:
-            logged_in = run_async(kite_client.is_logged_in())
-            if logged_in:
-                profile = run_async(kite_client.get_profile())
-                kite_client.mark_logged_in()
+            # Auth errors already come back as None; anything raised here is a
+            # transport failure (rate limit, dropped connection) worth retrying
+            profile = run_async(_with_backoff(kite_client.get_login_profile))
+            if profile:
                 SessionManager.set_logged_in(True, profile)
                 SessionManager.set_login_url(None)
                 st.rerun()
@@ -96,10 +136,8 @@ def check_initial_login_status(kite_client: KiteClient) -> None:
     SessionManager.set_checking_login(True)
     try:
         # Use shorter timeout for initial check to avoid blocking app load
-        logged_in = run_async(kite_client.is_logged_in(), timeout=10.0)
-        if logged_in:
-            profile = run_async(kite_client.get_profile(), timeout=10.0)
-            kite_client.mark_logged_in()
+        profile = run_async(kite_client.get_login_profile(), timeout=10.0)
+        if profile:
             SessionManager.set_logged_in(True, profile)
     except Exception:
         pass  # Silently fail on initial check
@@ -1,44 +1,76 @@
 """Portfolio display component for showing holdings and metrics."""
 
-import pandas as pd
+import numpy as np
 import streamlit as st
 
-from src.mcp.kite_client import KiteClient
+from src.mcp.kite_client import Holdings, KiteClient
 from src.ui.utils.async_bridge import run_async
 from src.ui.utils.session import SessionManager
 
+# Display formats for the numeric holdings table columns
+_DISPLAY_FORMATS = {
+    "Avg Price": "₹{:,.2f}",
+    "LTP": "₹{:,.2f}",
+    "P&L": "₹{:,.2f}",
+    "Change %": "{:+.2f}%",
+}
+
+# Seconds a holdings fetch is reused across reruns and components
+HOLDINGS_CACHE_TTL = 30
+
+# Seconds between automatic refreshes of the sidebar portfolio summary
+SUMMARY_REFRESH_INTERVAL = 60
+
+
+@st.cache_data(ttl=HOLDINGS_CACHE_TTL, show_spinner=False)
+def _fetch_holdings_cached(_kite_client: KiteClient, user_id: str) -> Holdings:
+    """Fetch holdings as columns, shared by every component for the TTL window.
+
+    Args:
+        _kite_client: The Kite MCP client instance (excluded from the cache key)
+        user_id: Logged-in user ID, so a different login never sees stale data
+
+    Returns:
+        Column-oriented holdings, built once per fetch
+    """
+    return run_async(_kite_client.get_holdings_columns())
+
+
+def _fetch_holdings(kite_client: KiteClient) -> Holdings:
+    """Fetch holdings for the current user through the shared cache.
 
-def _format_currency(value: float | None) -> str:
-    """Format a numeric value as currency with ₹ symbol.
-    
     Args:
-        value: The numeric value to format, may be None or NaN
-        
+        kite_client: The Kite MCP client instance
+
     Returns:
-        Formatted currency string (₹X,XXX.XX) or "-" if value is missing
+        Column-oriented holdings
     """
-    if pd.isna(value) or value is None:
-        return "-"
-    return f"₹{value:,.2f}"
+    profile = SessionManager.get_user_profile()
+    return _fetch_holdings_cached(kite_client, profile.user_id if profile else "")
+
 
+def _portfolio_totals(columns: Holdings) -> tuple[float, float, float]:
+    """Compute portfolio totals with vectorized column reductions.
 
-def _format_percentage(value: float | None) -> str:
-    """Format a numeric value as percentage with +/- sign.
-    
     Args:
-        value: The numeric value to format, may be None or NaN
-        
+        columns: Column-oriented holdings
+
     Returns:
-        Formatted percentage string (+X.XX% or -X.XX%) or "-" if value is missing
+        Tuple of (total_value, total_invested, total_pnl)
     """
-    if pd.isna(value) or value is None:
-        return "-"
-    return f"{value:+.2f}%"
+    total_value = float(columns.quantity @ columns.last_price)
+    total_invested = float(columns.quantity @ columns.average_price)
+    total_pnl = float(columns.pnl.sum())
+    return total_value, total_invested, total_pnl
 
 
+@st.fragment(run_every=SUMMARY_REFRESH_INTERVAL)
 def render_portfolio_summary(kite_client: KiteClient) -> None:
     """Render portfolio summary metrics in the sidebar.
 
+    Runs as a fragment that refreshes itself on a timer, so the Refresh
+    button and periodic updates rerun only the summary, not the chat.
+
     Args:
         kite_client: The Kite MCP client instance
     """
@@ -47,22 +79,24 @@ def render_portfolio_summary(kite_client: KiteClient) -> None:
 
     st.subheader("Portfolio Summary")
 
+    # Clicking reruns just this fragment, after the callback drops the cache
+    st.button(
+        "Refresh",
+        key="refresh_holdings",
+        use_container_width=True,
+        on_click=_fetch_holdings_cached.clear,
+    )
+
     try:
         with st.spinner("Loading..."):
-            holdings = run_async(kite_client.get_holdings())
+            holdings = _fetch_holdings(kite_client)
 
         if not holdings:
             st.info("No holdings found")
             return
 
         # Calculate metrics
-        total_value = sum(
-            h.get("quantity", 0) * h.get("last_price", 0) for h in holdings
-        )
-        total_invested = sum(
-            h.get("quantity", 0) * h.get("average_price", 0) for h in holdings
-        )
-        total_pnl = sum(h.get("pnl", 0) for h in holdings)
+        total_value, total_invested, total_pnl = _portfolio_totals(holdings)
         pnl_percent = (total_pnl / total_invested * 100) if total_invested > 0 else 0
 
         # Display metrics
@@ -85,40 +119,38 @@ def render_portfolio_summary(kite_client: KiteClient) -> None:
         st.error(f"Error loading portfolio: {e}")
 
 
-def _render_top_performers(holdings: list[dict]) -> None:
+def _render_top_performers(holdings: Holdings) -> None:
     """Render top gaining and losing stocks.
 
     Args:
-        holdings: List of holding dictionaries
+        holdings: Column-oriented holdings
     """
     if len(holdings) < 2:
         return
 
-    # Sort by P&L percentage
-    sorted_holdings = sorted(
-        holdings,
-        key=lambda h: h.get("day_change_percentage", 0),
-        reverse=True,
-    )
+    # Only the extremes are needed, so take arg-max/min instead of sorting.
+    # Ties resolve as the stable descending sort did: the first maximum and
+    # the last minimum.
+    changes = holdings.day_change_percentage
+    i_top = int(np.argmax(changes))
+    i_bottom = len(changes) - 1 - int(np.argmin(changes[::-1]))
 
     st.markdown("---")
     st.caption("Today's Movers")
 
     # Top gainer
-    top = sorted_holdings[0]
-    change = top.get("day_change_percentage", 0)
+    change = changes[i_top]
     if change > 0:
         st.markdown(
-            f"📈 **{top.get('tradingsymbol', 'N/A')}** "
+            f"📈 **{holdings.records[i_top].get('tradingsymbol', 'N/A')}** "
             f":green[+{change:.1f}%]"
         )
 
     # Top loser
-    bottom = sorted_holdings[-1]
-    change = bottom.get("day_change_percentage", 0)
+    change = changes[i_bottom]
     if change < 0:
         st.markdown(
-            f"📉 **{bottom.get('tradingsymbol', 'N/A')}** "
+            f"📉 **{holdings.records[i_bottom].get('tradingsymbol', 'N/A')}** "
             f":red[{change:.1f}%]"
         )
 
@@ -129,20 +161,24 @@ def render_holdings_table(kite_client: KiteClient) -> None:
     Args:
         kite_client: The Kite MCP client instance
     """
+    # Deferred: this is the only pandas user and the app does not render it
+    # by default
+    import pandas as pd
+
     if not SessionManager.is_logged_in():
         st.warning("Please login to view your holdings")
         return
 
     try:
         with st.spinner("Loading holdings..."):
-            holdings = run_async(kite_client.get_holdings())
+            holdings = _fetch_holdings(kite_client)
 
         if not holdings:
             st.info("No holdings found in your portfolio")
             return
 
         # Convert to DataFrame
-        df = pd.DataFrame(holdings)
+        df = pd.DataFrame(holdings.records)
 
         # Select and rename columns
         display_cols = {
@@ -159,23 +195,16 @@ def render_holdings_table(kite_client: KiteClient) -> None:
         df_display = df[available_cols].copy()
         df_display.columns = [display_cols[c] for c in available_cols]
 
-        # Format numeric columns
-        if "Avg Price" in df_display.columns:
-            df_display["Avg Price"] = df_display["Avg Price"].apply(_format_currency)
-        if "LTP" in df_display.columns:
-            df_display["LTP"] = df_display["LTP"].apply(_format_currency)
-        if "P&L" in df_display.columns:
-            df_display["P&L"] = df_display["P&L"].apply(_format_currency)
-        if "Change %" in df_display.columns:
-            df_display["Change %"] = df_display["Change %"].apply(_format_percentage)
+        # Format for display only; columns stay numeric so sorting still works
+        formats = {
+            col: fmt for col, fmt in _DISPLAY_FORMATS.items() if col in df_display.columns
+        }
+        styler = df_display.style.format(formats, na_rep="-")
 
-        st.dataframe(df_display, use_container_width=True, hide_index=True)
+        st.dataframe(styler, use_container_width=True, hide_index=True)
 
         # Summary row
-        total_pnl = sum(h.get("pnl", 0) for h in holdings)
-        total_value = sum(
-            h.get("quantity", 0) * h.get("last_price", 0) for h in holdings
-        )
+        total_value, _, total_pnl = _portfolio_totals(holdings)
         st.markdown(
             f"**Total Value:** ₹{total_value:,.2f} | "
             f"**Total P&L:** ₹{total_pnl:,.2f}"
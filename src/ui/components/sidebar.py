@@ -5,6 +5,7 @@ import streamlit as st
 from src.mcp.kite_client import KiteClient
 from src.ui.components.login import render_login
 from src.ui.components.portfolio_display import render_portfolio_summary
+from src.ui.utils.async_bridge import submit_async
 from src.ui.utils.session import SessionManager
 
 
@@ -62,7 +63,7 @@ def render_sidebar(kite_client: KiteClient) -> None:
         st.markdown("---")
 
         # Quick actions section
-        _render_quick_actions()
+        _render_quick_actions(kite_client)
 
         # Portfolio summary (only when logged in)
         if SessionManager.is_logged_in():
@@ -74,8 +75,12 @@ def render_sidebar(kite_client: KiteClient) -> None:
         _render_footer()
 
 
-def _render_quick_actions() -> None:
-    """Render quick action buttons."""
+def _render_quick_actions(kite_client: KiteClient) -> None:
+    """Render quick action buttons.
+
+    Args:
+        kite_client: The Kite MCP client instance
+    """
     st.subheader("Quick Actions")
 
     for action in QUICK_ACTIONS:
@@ -83,20 +88,25 @@ def _render_quick_actions() -> None:
 
         if st.button(button_label, key=f"action_{action['agent']}", use_container_width=True):
             if action["prompt"]:
-                # Direct prompt - set it as pending
+                # Direct prompt - set it as pending; the main area renders
+                # after the sidebar in this same run, so no rerun is needed
                 SessionManager.set_pending_prompt(action["prompt"])
-                st.rerun()
             else:
                 # Need user input - show input dialog
-                _handle_action_with_input(action)
+                _handle_action_with_input(action, kite_client)
 
 
-def _handle_action_with_input(action: dict) -> None:
+def _handle_action_with_input(action: dict, kite_client: KiteClient) -> None:
     """Handle an action that requires user input.
 
     Args:
         action: The action definition dictionary
+        kite_client: The Kite MCP client instance
     """
+    # These agents look the stock up in holdings; fetch them while the user types
+    if SessionManager.is_logged_in():
+        submit_async(kite_client.prefetch_holdings())
+
     # Store the action type in session state for the dialog
     if "pending_action" not in st.session_state:
         st.session_state.pending_action = None
@@ -113,39 +123,65 @@ def render_action_input_dialog() -> None:
 
     if pending_action == "stock_research":
         st.markdown("### Research a Stock")
-        stock_name = st.text_input(
+        st.text_input(
             "Enter stock name or symbol:",
             placeholder="e.g., Reliance, TCS, INFY",
             key="research_input",
         )
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("Research", type="primary") and stock_name:
-                SessionManager.set_pending_prompt(f"Tell me about {stock_name}")
-                st.session_state.pending_action = None
-                st.rerun()
+            st.button(
+                "Research",
+                type="primary",
+                on_click=_submit_action_prompt,
+                args=("research_input", "Tell me about {}"),
+            )
         with col2:
-            if st.button("Cancel"):
-                st.session_state.pending_action = None
-                st.rerun()
+            st.button("Cancel", on_click=_cancel_action)
 
     elif pending_action == "fundamental_analysis":
         st.markdown("### Fundamental Analysis")
-        stock_name = st.text_input(
+        st.text_input(
             "Enter stock name or symbol:",
             placeholder="e.g., Reliance, TCS, INFY",
             key="fundamental_input",
         )
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("Analyze", type="primary") and stock_name:
-                SessionManager.set_pending_prompt(f"Is {stock_name} a good buy?")
-                st.session_state.pending_action = None
-                st.rerun()
+            st.button(
+                "Analyze",
+                type="primary",
+                on_click=_submit_action_prompt,
+                args=("fundamental_input", "Is {} a good buy?"),
+            )
         with col2:
-            if st.button("Cancel"):
-                st.session_state.pending_action = None
-                st.rerun()
+            st.button("Cancel", on_click=_cancel_action)
+
+
+def _submit_action_prompt(input_key: str, template: str) -> None:
+    """Button callback: queue the dialog's prompt and close the dialog.
+
+    Callbacks run before the rerun the click triggers, so the updated state
+    is rendered without a second st.rerun().
+
+    Args:
+        input_key: Session state key of the dialog's text input
+        template: Prompt template with a {} placeholder for the stock name
+    """
+    stock_name = st.session_state.get(input_key)
+    if stock_name:
+        SessionManager.set_pending_prompt(template.format(stock_name))
+        st.session_state.pending_action = None
+
+
+def _cancel_action() -> None:
+    """Button callback: close the action input dialog."""
+    st.session_state.pending_action = None
+
+
+def _close_about() -> None:
+    """Button callback: hide the About panel."""
+    st.session_state.show_about = False
 
 
 def _render_footer() -> None:
@@ -154,9 +190,11 @@ def _render_footer() -> None:
 
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("Clear Chat", use_container_width=True):
-            SessionManager.clear_chat_history()
-            st.rerun()
+        st.button(
+            "Clear Chat",
+            use_container_width=True,
+            on_click=SessionManager.clear_chat_history,
+        )
     with col2:
         if st.button("About", use_container_width=True):
             st.session_state.show_about = True
@@ -173,6 +211,4 @@ def _render_footer() -> None:
             This is a learning project - not financial advice!
             """
         )
-        if st.button("Close"):
-            st.session_state.show_about = False
-            st.rerun()
+        st.button("Close", on_click=_close_about)
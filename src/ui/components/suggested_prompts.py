@@ -35,32 +35,67 @@ SUGGESTED_PROMPTS = {
     ],
 }
 
+# (category, widget key, prompts) per chip group, built once at import;
+# only the first 2 prompts per category are shown to keep it compact
+_PROMPT_CHIPS = tuple(
+    (category, f"prompts_{category}", tuple(prompts[:2]))
+    for category, prompts in SUGGESTED_PROMPTS.items()
+)
+
+# Representative prompts from different categories for the compact row,
+# with their button keys
+_SAMPLE_BUTTONS = tuple(
+    (f"sample_{idx}", prompt)
+    for idx, prompt in enumerate([
+        "Analyze my portfolio",
+        "Tell me about Reliance",
+        "Why is my portfolio down?",
+        "Suggest watchlist stocks",
+    ])
+)
+
+
+def _format_prompt_label(prompt: str) -> str:
+    """Truncate a prompt to fit a chip."""
+    return prompt[:30] + "..." if len(prompt) > 30 else prompt
+
+
+def _select_prompt(key: str) -> None:
+    """Pills callback: queue the chosen prompt and clear the selection.
+
+    Runs before the rerun the click triggers, so no explicit st.rerun()
+    is needed for the chat to pick the prompt up.
+
+    Args:
+        key: Session state key of the pills widget
+    """
+    prompt = st.session_state.get(key)
+    if prompt:
+        SessionManager.set_pending_prompt(prompt)
+        st.session_state[key] = None
+
 
 def render_suggested_prompts() -> None:
     """Render suggested prompts as clickable chips.
 
     When a prompt is clicked, it sets the pending prompt in session state.
+    Each category is a single pills widget rather than one button per prompt.
     """
     st.markdown("**Try asking:**")
 
     # Create a more compact display using columns
-    cols = st.columns(len(SUGGESTED_PROMPTS))
-
-    for idx, (category, prompts) in enumerate(SUGGESTED_PROMPTS.items()):
-        with cols[idx]:
-            st.caption(category)
-            # Show first 2 prompts per category to keep it compact
-            for prompt in prompts[:2]:
-                # Use a unique key for each button
-                key = f"prompt_{category}_{prompts.index(prompt)}"
-                if st.button(
-                    prompt[:30] + "..." if len(prompt) > 30 else prompt,
-                    key=key,
-                    help=prompt,
-                    use_container_width=True,
-                ):
-                    SessionManager.set_pending_prompt(prompt)
-                    st.rerun()
+    cols = st.columns(len(_PROMPT_CHIPS))
+
+    for col, (category, key, prompts) in zip(cols, _PROMPT_CHIPS):
+        with col:
+            st.pills(
+                category,
+                prompts,
+                format_func=_format_prompt_label,
+                key=key,
+                on_change=_select_prompt,
+                args=(key,),
+            )
 
 
 def render_suggested_prompts_compact() -> None:
@@ -68,17 +103,13 @@ def render_suggested_prompts_compact() -> None:
 
     Shows a subset of prompts in a single row.
     """
-    # Select representative prompts from different categories
-    sample_prompts = [
-        "Analyze my portfolio",
-        "Tell me about Reliance",
-        "Why is my portfolio down?",
-        "Suggest watchlist stocks",
-    ]
-
-    cols = st.columns(len(sample_prompts))
-    for idx, prompt in enumerate(sample_prompts):
-        with cols[idx]:
-            if st.button(prompt, key=f"sample_{idx}", use_container_width=True):
-                SessionManager.set_pending_prompt(prompt)
-                st.rerun()
+    cols = st.columns(len(_SAMPLE_BUTTONS))
+    for col, (key, prompt) in zip(cols, _SAMPLE_BUTTONS):
+        with col:
+            st.button(
+                prompt,
+                key=key,
+                use_container_width=True,
+                on_click=SessionManager.set_pending_prompt,
+                args=(prompt,),
+            )
@@ -1,21 +1,26 @@
 #!/usr/bin/env python3
 """Streamlit web interface for Portfolio Copilot."""
 
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
 import structlog
 import streamlit as st
 
 from src.core.logging import setup_logging
 
-from src.agents.orchestrator import AgentOrchestrator
-from src.llm.claude import PortfolioAssistant
 from src.mcp.kite_client import KiteClient
 from src.ui.components.chat import render_chat, render_empty_chat_state
 from src.ui.components.login import check_initial_login_status
 from src.ui.components.sidebar import render_action_input_dialog, render_sidebar
 from src.ui.components.suggested_prompts import render_suggested_prompts
-from src.ui.utils.async_bridge import run_async
+from src.ui.utils.async_bridge import submit_async
 from src.ui.utils.session import SessionManager
 
+if TYPE_CHECKING:
+    from src.agents.orchestrator import AgentOrchestrator
+    from src.llm.claude import PortfolioAssistant
+
 # Page configuration
 st.set_page_config(
     page_title="Portfolio Copilot",
@@ -51,42 +56,48 @@ setup_logging()
 log = structlog.get_logger()
 
 
+def _log_connect_failure(future: Future[None]) -> None:
+    """Log a failed background connection attempt."""
+    error = future.exception()
+    if error is not None:
+        log.error("kite_connect_failed", exc_info=error)
+
+
 @st.cache_resource
 def get_kite_client() -> KiteClient:
     """Get or create a cached KiteClient instance.
 
     Uses st.cache_resource to maintain a single connection across reruns.
+    The connection is opened in the background so the first page render is
+    not blocked; calls made before it completes wait on the client's
+    connect lock, and a failed attempt is retried on the next call.
     """
     client = KiteClient()
-    # Connect the client with a timeout
-    try:
-        run_async(client.connect(), timeout=15.0)
-    except TimeoutError:
-        # Connection timed out, return client anyway (will retry on use)
-        log.error("kite_connect_timeout", exc_info=True)
-    except Exception:
-        # Connection failed, return client anyway (will retry on use)
-        log.error("kite_connect_failed", exc_info=True)
+    submit_async(client.connect()).add_done_callback(_log_connect_failure)
     return client
 
 
 @st.cache_resource
-def get_assistant(_kite_client: KiteClient) -> PortfolioAssistant:
+def get_assistant(_kite_client: KiteClient) -> "PortfolioAssistant":
     """Get or create a cached PortfolioAssistant instance.
 
     Args:
         _kite_client: The Kite client (underscore prefix for cache key)
     """
+    from src.llm.claude import PortfolioAssistant
+
     return PortfolioAssistant(_kite_client)
 
 
 @st.cache_resource
-def get_orchestrator(_kite_client: KiteClient) -> AgentOrchestrator:
+def get_orchestrator(_kite_client: KiteClient) -> "AgentOrchestrator":
     """Get or create a cached AgentOrchestrator instance.
 
     Args:
         _kite_client: The Kite client (underscore prefix for cache key)
     """
+    from src.agents.orchestrator import AgentOrchestrator
+
     return AgentOrchestrator(_kite_client)
 
 
@@ -97,8 +108,6 @@ def main() -> None:
 
     # Get cached instances
     kite_client = get_kite_client()
-    assistant = get_assistant(kite_client)
-    orchestrator = get_orchestrator(kite_client)
 
     # Check initial login status (only on first load)
     if "initial_login_checked" not in st.session_state:
@@ -108,14 +117,18 @@ def main() -> None:
     # Render sidebar
     render_sidebar(kite_client)
 
+    # Created after the sidebar so it paints while the LLM stack first loads
+    assistant = get_assistant(kite_client)
+    orchestrator = get_orchestrator(kite_client)
+
     # Main content area
     _render_main_content(kite_client, assistant, orchestrator)
 
 
 def _render_main_content(
     kite_client: KiteClient,
-    assistant: PortfolioAssistant,
-    orchestrator: AgentOrchestrator,
+    assistant: "PortfolioAssistant",
+    orchestrator: "AgentOrchestrator",
 ) -> None:
     """Render the main content area.
 
@@ -133,7 +146,7 @@ def _render_main_content(
     chat_history = SessionManager.get_chat_history()
 
     # Check for pending prompt first (from suggested prompts or empty state input)
-    pending_prompt = SessionManager.get_pending_prompt()
+    pending_prompt = SessionManager.peek_pending_prompt()
 
     if not chat_history and not pending_prompt:
         # Show welcome message and suggestions for empty chat
@@ -147,10 +160,8 @@ def _render_main_content(
             SessionManager.set_pending_prompt(user_input)
             st.rerun()
     else:
-        # If we have a pending prompt, set it back for render_chat to process
-        if pending_prompt:
-            SessionManager.set_pending_prompt(pending_prompt)
-        # Render chat interface (handles both history display and new queries)
+        # Render chat interface (handles both history display and new queries,
+        # consuming the pending prompt)
         render_chat(kite_client, assistant, orchestrator)
 
 
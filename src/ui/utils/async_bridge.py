@@ -3,41 +3,65 @@
 import asyncio
 import threading
 from concurrent.futures import Future
-from typing import Any, Coroutine, TypeVar
+from typing import Any, AsyncIterator, Coroutine, Iterator, TypeVar
 
-T = TypeVar("T")
-
-# Background thread with its own event loop for async operations
-_loop: asyncio.AbstractEventLoop | None = None
-_thread: threading.Thread | None = None
-_loop_lock = threading.Lock()
-
-
-def _start_background_loop() -> asyncio.AbstractEventLoop:
-    """Start a background thread with an event loop."""
-    global _loop, _thread
+import streamlit as st
 
-    # First check (fast path) - no lock needed if already initialized
-    if _loop is not None and _thread is not None and _thread.is_alive():
-        return _loop
+T = TypeVar("T")
 
-    # Acquire lock for the check-and-create sequence
-    with _loop_lock:
-        # Double-check after acquiring lock
-        if _loop is not None and _thread is not None and _thread.is_alive():
-            return _loop
+# Name of the thread running the background loop; the thread carries the
+# loop as its ``loop`` attribute so it can be found again process-wide
+_LOOP_THREAD_NAME = "async-bridge-loop"
 
-        # Create new loop and thread while holding the lock
-        _loop = asyncio.new_event_loop()
 
-        def run_loop():
-            asyncio.set_event_loop(_loop)
-            _loop.run_forever()
+def _find_running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the loop of a live background loop thread, if one exists."""
+    for thread in threading.enumerate():
+        loop = getattr(thread, "loop", None)
+        if thread.name == _LOOP_THREAD_NAME and loop is not None and not loop.is_closed():
+            return loop
+    return None
 
-        _thread = threading.Thread(target=run_loop, daemon=True)
-        _thread.start()
 
-        return _loop
+@st.cache_resource(show_spinner=False, validate=lambda loop: not loop.is_closed())
+def _start_background_loop() -> asyncio.AbstractEventLoop:
+    """Start a background thread with an event loop.
+
+    Cached as a Streamlit resource for fast lookup. Clearing the cache or
+    reloading this module must not start a second loop (clients bound to
+    the first one would break), so a loop thread that is still running is
+    reused; a loop that has shut down fails validation and is replaced.
+    Coroutines only ever run on this one thread, so nothing may block on
+    the loop from inside it (see run_async).
+    """
+    existing = _find_running_loop()
+    if existing is not None:
+        return existing
+
+    loop = asyncio.new_event_loop()
+    # Run submitted coroutines eagerly so ones that finish without
+    # blocking (cache hits) skip a loop iteration
+    loop.set_task_factory(asyncio.eager_task_factory)
+
+    def run_loop():
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=run_loop, name=_LOOP_THREAD_NAME, daemon=True)
+    thread.loop = loop  # type: ignore[attr-defined]
+    thread.start()
+    return loop
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """Check whether the caller is running on the given loop's thread."""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
 
 
 def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = 30.0) -> T:
@@ -55,9 +79,13 @@ def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = 30.0) -> T:
         The result of the coroutine
 
     Raises:
+        RuntimeError: If called from a coroutine on the background loop
         TimeoutError: If the operation exceeds the timeout
     """
     loop = _start_background_loop()
+    if _on_loop_thread(loop):
+        coro.close()
+        raise RuntimeError("run_async cannot block on the background loop from its own thread")
 
     # Submit the coroutine to the background loop and wait for result
     future: Future[T] = asyncio.run_coroutine_threadsafe(coro, loop)
@@ -73,6 +101,47 @@ def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = 30.0) -> T:
         )
 
 
+def submit_async(coro: Coroutine[Any, Any, T]) -> Future[T]:
+    """Schedule a coroutine on the background loop without waiting for it.
+
+    Args:
+        coro: The coroutine to execute
+
+    Returns:
+        A future that resolves with the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _start_background_loop())
+
+
+def iter_async(aiter: AsyncIterator[T], timeout: float | None = 30.0) -> Iterator[T]:
+    """Iterate an async iterator from Streamlit's sync context.
+
+    Each item is pulled on the background event loop as it becomes
+    available, so callers can render results incrementally.
+
+    Args:
+        aiter: The async iterator to consume
+        timeout: Maximum seconds to wait for each item (None for no timeout)
+
+    Yields:
+        Items from the async iterator
+
+    Raises:
+        TimeoutError: If waiting for an item exceeds the timeout
+    """
+    try:
+        while True:
+            try:
+                yield run_async(anext(aiter), timeout=timeout)
+            except StopAsyncIteration:
+                return
+    finally:
+        # Finalize async generators on their own loop if iteration stopped early
+        aclose = getattr(aiter, "aclose", None)
+        if aclose is not None:
+            asyncio.run_coroutine_threadsafe(aclose(), _start_background_loop())
+
+
 async def gather_async(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
     """Run multiple coroutines concurrently.
 
@@ -83,3 +152,21 @@ async def gather_async(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
         List of results from each coroutine
     """
     return await asyncio.gather(*coros, return_exceptions=True)
+
+
+async def gather_async_ok(
+    *coros: Coroutine[Any, Any, Any],
+) -> tuple[list[Any], list[BaseException]]:
+    """Run multiple coroutines concurrently, separating results from errors.
+
+    Args:
+        *coros: Coroutines to run
+
+    Returns:
+        Tuple of (successful results, raised exceptions), each in input order
+    """
+    results: list[Any] = []
+    errors: list[BaseException] = []
+    for result in await asyncio.gather(*coros, return_exceptions=True):
+        (errors if isinstance(result, BaseException) else results).append(result)
+    return results, errors
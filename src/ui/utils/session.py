@@ -1,22 +1,32 @@
 """Session state management for Streamlit."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 import streamlit as st
 
+# Most recent chat messages kept per session; older ones are dropped
+MAX_HISTORY = 200
 
-@dataclass
+
+@dataclass(slots=True)
 class ChatMessage:
     """A chat message in the conversation history."""
 
     role: str  # "user" or "assistant"
     content: str
     agent_used: str | None = None  # Which agent handled this, if any
-    metadata: dict[str, Any] | None = None  # Extra data (e.g. events list)
+    metadata_json: bytes | None = None  # Extra data (e.g. events list), JSON-encoded
+
+    @property
+    def metadata(self) -> dict[str, Any] | None:
+        """Extra data decoded from metadata_json, if any."""
+        return orjson.loads(self.metadata_json) if self.metadata_json else None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """User profile information from Kite."""
 
@@ -26,7 +36,7 @@ class UserProfile:
     broker: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Container for all session state."""
 
@@ -36,12 +46,24 @@ class SessionState:
     pending_prompt: str | None = None  # For suggested prompt clicks
 
 
+def _encode_metadata(metadata: dict[str, Any]) -> bytes:
+    """Encode message metadata, stringifying anything JSON can't represent.
+
+    Stored encoded so long histories don't keep nested objects alive.
+    """
+    return orjson.dumps(metadata, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 class SessionManager:
     """Manages Streamlit session state."""
 
     @staticmethod
     def initialize() -> None:
-        """Initialize session state with defaults if not already set."""
+        """Initialize session state with defaults if not already set.
+
+        Must run at the start of every script run; the accessors below read
+        these keys directly rather than through get() with a default.
+        """
         if "initialized" not in st.session_state:
             st.session_state.initialized = True
             st.session_state.logged_in = False
@@ -54,31 +76,33 @@ class SessionManager:
     @staticmethod
     def is_logged_in() -> bool:
         """Check if user is logged in."""
-        return st.session_state.get("logged_in", False)
+        return st.session_state.logged_in
 
     @staticmethod
     def set_logged_in(logged_in: bool, profile: dict[str, Any] | None = None) -> None:
         """Set login status and user profile."""
         st.session_state.logged_in = logged_in
         if profile:
-            st.session_state.user_profile = UserProfile(
-                user_id=profile.get("user_id", ""),
-                user_name=profile.get("user_name", ""),
-                email=profile.get("email", ""),
-                broker=profile.get("broker", ""),
-            )
+            user_profile = st.session_state.user_profile
+            if user_profile is None:
+                user_profile = st.session_state.user_profile = UserProfile()
+            # Refresh the existing profile in place rather than replacing it
+            user_profile.user_id = profile.get("user_id", "")
+            user_profile.user_name = profile.get("user_name", "")
+            user_profile.email = profile.get("email", "")
+            user_profile.broker = profile.get("broker", "")
         elif not logged_in:
             st.session_state.user_profile = None
 
     @staticmethod
     def get_user_profile() -> UserProfile | None:
         """Get the current user profile."""
-        return st.session_state.get("user_profile")
+        return st.session_state.user_profile
 
     @staticmethod
     def get_chat_history() -> list[ChatMessage]:
         """Get chat history."""
-        return st.session_state.get("chat_history", [])
+        return st.session_state.chat_history
 
     @staticmethod
     def add_message(
@@ -90,9 +114,21 @@ class SessionManager:
         """Add a message to chat history."""
         if "chat_history" not in st.session_state:
             st.session_state.chat_history = []
-        st.session_state.chat_history.append(
-            ChatMessage(role=role, content=content, agent_used=agent_used, metadata=metadata)
+        # Agent names come from a small fixed set; share one string per name
+        if agent_used:
+            agent_used = sys.intern(agent_used)
+        history = st.session_state.chat_history
+        history.append(
+            ChatMessage(
+                role=role,
+                content=content,
+                agent_used=agent_used,
+                metadata_json=_encode_metadata(metadata) if metadata else None,
+            )
         )
+        if len(history) > MAX_HISTORY:
+            # Trim in place so references to the list stay valid
+            history[:] = history[-MAX_HISTORY:]
 
     @staticmethod
     def clear_chat_history() -> None:
@@ -104,10 +140,15 @@ class SessionManager:
         """Set a pending prompt to be processed."""
         st.session_state.pending_prompt = prompt
 
+    @staticmethod
+    def peek_pending_prompt() -> str | None:
+        """Get the pending prompt without clearing it."""
+        return st.session_state.pending_prompt
+
     @staticmethod
     def get_pending_prompt() -> str | None:
         """Get and clear the pending prompt."""
-        prompt = st.session_state.get("pending_prompt")
+        prompt = st.session_state.pending_prompt
         st.session_state.pending_prompt = None
         return prompt
 
@@ -119,7 +160,7 @@ class SessionManager:
     @staticmethod
     def get_login_url() -> str | None:
         """Get the login URL."""
-        return st.session_state.get("login_url")
+        return st.session_state.login_url
 
     @staticmethod
     def set_checking_login(checking: bool) -> None:
@@ -129,4 +170,4 @@ class SessionManager:
     @staticmethod
     def is_checking_login() -> bool:
         """Check if we're currently checking login status."""
-        return st.session_state.get("checking_login", False)
+        return st.session_state.checking_login
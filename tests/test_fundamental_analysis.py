@@ -4,6 +4,7 @@ from src.agents.tools.symbol_tools import extract_symbol
 from src.agents.workflows.fundamental_analysis import (
     FundamentalScore,
     analyze_fundamentals,
+    analyze_fundamentals_batch,
 )
 from src.data.scrapers.screener import FundamentalData
 
@@ -171,6 +172,27 @@ class TestAnalyzeFundamentals:
         assert -1 <= score.total_score <= 4  # Should be around HOLD to BUY
         assert score.recommendation in ("HOLD", "BUY")
 
+    def test_batch_matches_scalar(self):
+        """Test that batch scoring agrees with per-stock scoring."""
+        datas = [
+            FundamentalData(symbol="A", pe_ratio=10, pb_ratio=1, roe=25, debt_to_equity=0.2),
+            FundamentalData(symbol="B", pe_ratio=60, roce=5, profit_growth_3yr=2),
+            FundamentalData(symbol="C", promoter_holding=20, promoter_holding_change=-5),
+            FundamentalData(
+                symbol="D", revenue_growth_3yr=20, promoter_holding=70, promoter_holding_change=1
+            ),
+            FundamentalData(symbol="E"),
+        ]
+        batch = analyze_fundamentals_batch(datas)
+        for data, row in zip(datas, batch, strict=True):
+            score = analyze_fundamentals(data)
+            assert row["valuation"] == score.valuation_score
+            assert row["profitability"] == score.profitability_score
+            assert row["growth"] == score.growth_score
+            assert row["financial_health"] == score.financial_health_score
+            assert row["promoter"] == score.promoter_score
+            assert row["total"] == score.total_score
+
 
 class TestExtractSymbol:
     """Test symbol extraction from queries."""
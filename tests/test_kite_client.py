@@ -0,0 +1,53 @@
+"""Tests for Kite client caching."""
+
+import pytest
+
+from src.mcp.kite_client import KiteClient
+
+
+class TestProfileCache:
+    """Test that only logged-in profiles are cached."""
+
+    @pytest.mark.asyncio
+    async def test_login_visible_right_after_logged_out_response(self):
+        """Test a logged-out payload isn't served from cache after login."""
+        client = KiteClient()
+        responses = iter(['{"error": "not logged in"}', '{"user_id": "AB1234"}'])
+
+        async def call_tool(tool_name, args=None):
+            return next(responses)
+
+        client._call_tool = call_tool
+
+        assert await client.get_login_profile() is None
+        profile = await client.get_login_profile()
+        assert profile == {"user_id": "AB1234"}
+        assert await client.is_logged_in()
+
+
+class TestHoldingsPrefetch:
+    """Test the background holdings prefetch."""
+
+    @pytest.mark.asyncio
+    async def test_stale_prefetch_is_replaced(self):
+        """Test a prefetch older than the TTL doesn't block a new one."""
+        client = KiteClient()
+        calls = []
+
+        async def call_tool(tool_name, args=None):
+            calls.append(tool_name)
+            return '[{"tradingsymbol": "TCS"}]'
+
+        client._call_tool = call_tool
+
+        await client.prefetch_holdings()
+        started_at, first = client._holdings_prefetch
+        client._holdings_prefetch = (started_at - 60, first)
+        await client.prefetch_holdings()
+        assert client._holdings_prefetch[1] is not first
+
+        # The UI column fetch leaves the prefetch for get_holdings
+        await client.get_holdings_columns()
+        assert client._holdings_prefetch is not None
+        assert await client.get_holdings() == [{"tradingsymbol": "TCS"}]
+        assert client._holdings_prefetch is None
@@ -1,16 +1,19 @@
 """Tests for agent orchestrator pattern matching."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
 
 from src.agents.orchestrator import AgentOrchestrator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def orchestrator():
-    """Create orchestrator with mock client."""
-    mock_client = MagicMock()
-    return AgentOrchestrator(mock_client)
+    """Create orchestrator with a bare stub client.
+
+    Routing never touches the client, so any attribute access fails loudly.
+    """
+    return AgentOrchestrator(SimpleNamespace())
 
 
 class TestPortfolioAnalysisPatterns:
@@ -162,3 +165,10 @@ class TestPatternPriority:
         should_use, agent_type = orchestrator.should_use_agent(query)
         assert should_use is True
         assert agent_type == "portfolio_analysis"
+
+    def test_priority_beats_match_position(self, orchestrator):
+        """Test that agent priority wins over where in the query a pattern matches."""
+        query = "Tell me about events for TCS"
+        _, agent_type = orchestrator.should_use_agent(query)
+        # The research phrase comes first, but events patterns are checked earlier
+        assert agent_type == "stock_events"
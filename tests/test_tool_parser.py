@@ -0,0 +1,68 @@
+"""Tests for Ollama prompt-based tool call parsing."""
+
+from src.llm.tool_parser import parse_tool_calls_from_text
+from src.llm.tools import get_all_tools
+
+
+class TestRawJsonToolCalls:
+    """Test raw JSON tool calls on their own line (no code fence)."""
+
+    def test_flat_input(self):
+        """Test a single-line tool call with a flat input object."""
+        text = '{"name": "get_holdings", "input": {}}'
+        remaining, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert [c.name for c in calls] == ["get_holdings"]
+        assert calls[0].input == {}
+        assert remaining == ""
+
+    def test_nested_input(self):
+        """Test that nested input objects are parsed intact."""
+        text = 'Let me check.\n{"name": "get_quotes", "input": {"instruments": ["NSE:TCS"], "opts": {"a": 1}}}'
+        remaining, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert len(calls) == 1
+        assert calls[0].input == {"instruments": ["NSE:TCS"], "opts": {"a": 1}}
+        assert remaining == "Let me check."
+
+    def test_braces_inside_strings(self):
+        """Test that braces inside JSON strings don't break the scan."""
+        text = '{"name": "search_news", "input": {"query": "results } {"}}'
+        _, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert len(calls) == 1
+        assert calls[0].input == {"query": "results } {"}
+
+    def test_inline_json_ignored(self):
+        """Test that JSON embedded mid-sentence is not treated as a call."""
+        text = 'The format is {"name": "get_holdings", "input": {}} as shown.'
+        remaining, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert calls == []
+        assert remaining == text
+
+    def test_unmatched_brace_in_prose(self):
+        """Test that a stray opening brace doesn't hide a later tool call."""
+        text = 'Use { carefully.\n{"name": "get_holdings", "input": {}}'
+        remaining, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert [c.name for c in calls] == ["get_holdings"]
+        assert remaining == "Use { carefully."
+
+    def test_many_unmatched_braces(self):
+        """Test that many stray braces are scanned in one pass."""
+        text = "{ " * 20000 + '\n{"name": "get_holdings", "input": {}}'
+        _, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert [c.name for c in calls] == ["get_holdings"]
+
+    def test_unknown_tool_rejected(self):
+        """Test that tool names outside the provided list are rejected."""
+        text = '{"name": "place_order", "input": {"symbol": "TCS"}}'
+        _, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert calls == []
+
+
+class TestFencedToolCalls:
+    """Test tool calls wrapped in code fences."""
+
+    def test_json_block(self):
+        """Test a ```json fenced tool call."""
+        text = 'Sure.\n```json\n{"name": "get_positions", "input": {}}\n```'
+        remaining, calls = parse_tool_calls_from_text(text, get_all_tools())
+        assert [c.name for c in calls] == ["get_positions"]
+        assert remaining == "Sure."